@@ -1,26 +1,79 @@
 """Audio player module using pygame mixer."""
+import platform
+import time
+from typing import Optional
+
 import pygame
 
+try:
+    from mutagen import File as MutagenFile
+except ImportError:
+    MutagenFile = None
+
+# Mixer buffer size in samples. Small buffers underrun on ALSA/PipeWire,
+# which causes popping and makes get_pos() jittery.
+if platform.system() == 'Windows':
+    DEFAULT_BUFFER = 512
+elif platform.system() == 'Linux':
+    DEFAULT_BUFFER = 2048
+else:
+    DEFAULT_BUFFER = 1024
+
+MIXER_FREQUENCY = 44100
+MIXER_SIZE = -16
+MIXER_CHANNELS = 2
+
+_preinit_buffer = None  # buffer size passed to pre_init_mixer(), if it was called
+
+# Posted by the mixer when music finishes or is stopped; pass it to
+# AudioPlayer.handle_event().
+MUSIC_END_EVENT = pygame.USEREVENT + 1
+
+
+def pre_init_mixer(buffer: int = DEFAULT_BUFFER):
+    """Set the mixer parameters; call before pygame.init() so its mixer init uses them."""
+    global _preinit_buffer
+    # allowedchanges=0 makes SDL convert to our format instead of picking its own
+    pygame.mixer.pre_init(frequency=MIXER_FREQUENCY, size=MIXER_SIZE, channels=MIXER_CHANNELS,
+                          buffer=buffer, allowedchanges=0)
+    _preinit_buffer = buffer
+
 
 class AudioPlayer:
-    def __init__(self):
-        pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
-        self.file_path = None
-        self.duration = 0
+    # get_pos() drifts and is quantized to the buffer period, so position is
+    # measured on the monotonic clock and nudged towards the mixer this often
+    RESYNC_INTERVAL = 1.0  # seconds
+    DRIFT_SMOOTHING = 0.1  # fraction of the measured drift corrected per resync
+    # Playing state is cached and only re-polled from the mixer this often, in
+    # case the end event isn't delivered (e.g. while events aren't pumped)
+    BUSY_POLL_INTERVAL = 0.05  # seconds
+
+    def __init__(self, buffer: int = DEFAULT_BUFFER):
+        # pygame.init() may already have started the mixer. Keep it only if it was
+        # configured by pre_init_mixer() with the same buffer (get_init() doesn't report
+        # the buffer size); otherwise init() would silently keep the old settings.
+        if (pygame.mixer.get_init() != (MIXER_FREQUENCY, MIXER_SIZE, MIXER_CHANNELS)
+                or _preinit_buffer != buffer):
+            pygame.mixer.quit()
+            pygame.mixer.init(frequency=MIXER_FREQUENCY, size=MIXER_SIZE, channels=MIXER_CHANNELS,
+                              buffer=buffer, allowedchanges=0)
+        pygame.mixer.music.set_endevent(MUSIC_END_EVENT)
+        self.file_path: Optional[str] = None
+        self.duration: float = 0
         self._paused = False
-        self._start_offset = 0
-        self._pause_pos = 0
+        self._start_offset: float = 0
+        self._pause_pos: float = 0
+        self._play_wallclock = 0.0  # monotonic time at which playback was at _start_offset
+        self._last_resync = 0.0
+        self._busy = False  # cached pygame.mixer.music.get_busy()
+        self._busy_checked = 0.0
 
     def load(self, file_path: str) -> bool:
         """Load an audio file. Returns True on success."""
         try:
             pygame.mixer.music.load(file_path)
             self.file_path = file_path
-            # Get duration using Sound object (temporary load)
-            sound = pygame.mixer.Sound(file_path)
-            self.duration = sound.get_length()
-            sound.stop()
-            del sound
+            self.duration = self._read_duration(file_path)
             self._start_offset = 0
             self._pause_pos = 0
             self._paused = False
@@ -29,16 +82,35 @@ class AudioPlayer:
             print(f"Error loading audio: {e}")
             return False
 
+    def _read_duration(self, file_path: str) -> float:
+        """Get the duration from file metadata, only decoding the file as a fallback."""
+        if MutagenFile is not None:
+            try:
+                info = MutagenFile(file_path)
+                if info is not None and info.info.length:
+                    return info.info.length
+            except Exception:
+                pass
+        # Get duration using Sound object (temporary load)
+        sound = pygame.mixer.Sound(file_path)
+        duration = sound.get_length()
+        sound.stop()
+        del sound
+        return duration
+
     def play(self, start_pos: float = 0):
         """Start playback from position (in seconds)."""
         if self.file_path:
             self._start_offset = start_pos
             pygame.mixer.music.play(start=start_pos)
+            self._play_wallclock = self._last_resync = time.monotonic()
+            self._busy = True
+            self._busy_checked = self._play_wallclock
             self._paused = False
 
     def pause(self):
         """Pause playback."""
-        if pygame.mixer.music.get_busy():
+        if self._is_busy():
             self._pause_pos = self.get_position()
             pygame.mixer.music.pause()
             self._paused = True
@@ -47,13 +119,16 @@ class AudioPlayer:
         """Resume playback."""
         if self._paused:
             pygame.mixer.music.unpause()
+            # Re-anchor so the paused stretch isn't counted as played time
+            self._play_wallclock = time.monotonic() - (self._pause_pos - self._start_offset)
+            self._last_resync = time.monotonic()
             self._paused = False
 
     def toggle_pause(self):
         """Toggle between play and pause."""
         if self._paused:
             self.unpause()
-        elif pygame.mixer.music.get_busy():
+        elif self._is_busy():
             self.pause()
         else:
             # Not playing, start from pause position or beginning
@@ -62,6 +137,7 @@ class AudioPlayer:
     def stop(self):
         """Stop playback."""
         pygame.mixer.music.stop()
+        self._busy = False
         self._paused = False
         self._pause_pos = 0
 
@@ -69,14 +145,26 @@ class AudioPlayer:
         """Get current playback position in seconds."""
         if self._paused:
             return self._pause_pos
-        if pygame.mixer.music.get_busy():
-            # pygame returns position in milliseconds from start of play call
-            return self._start_offset + (pygame.mixer.music.get_pos() / 1000.0)
+        if self._is_busy():
+            now = time.monotonic()
+            if now - self._last_resync >= self.RESYNC_INTERVAL:
+                self._resync(now)
+            return self._start_offset + (now - self._play_wallclock)
         return self._pause_pos
 
+    def _resync(self, now: float):
+        """Pull the wall-clock anchor part of the way towards the mixer position."""
+        self._last_resync = now
+        # pygame returns position in milliseconds from start of play call
+        mixer_ms = pygame.mixer.music.get_pos()
+        if mixer_ms < 0:
+            return
+        drift = (now - self._play_wallclock) - mixer_ms / 1000.0
+        self._play_wallclock += drift * self.DRIFT_SMOOTHING
+
     def set_position(self, pos: float):
         """Seek to position (in seconds)."""
-        was_playing = pygame.mixer.music.get_busy() or self._paused
+        was_playing = self._is_busy() or self._paused
         self.stop()
         if was_playing:
             self.play(pos)
@@ -85,7 +173,26 @@ class AudioPlayer:
 
     def is_playing(self) -> bool:
         """Check if audio is currently playing."""
-        return pygame.mixer.music.get_busy() and not self._paused
+        return self._is_busy()
+
+    def _is_busy(self) -> bool:
+        """Whether music is playing (and not paused)."""
+        if self._paused or not self._busy:
+            return False
+        now = time.monotonic()
+        if now - self._busy_checked >= self.BUSY_POLL_INTERVAL:
+            self._busy_checked = now
+            self._busy = pygame.mixer.music.get_busy()
+        return self._busy
+
+    def handle_event(self, event):
+        """Update the cached playing state from MUSIC_END_EVENT."""
+        if event.type == MUSIC_END_EVENT:
+            # A seek stops and restarts the music, which can leave an end event
+            # from the old stream in the queue, so ask the mixer rather than
+            # assuming playback stopped.
+            self._busy_checked = time.monotonic()
+            self._busy = pygame.mixer.music.get_busy()
 
     def is_paused(self) -> bool:
         """Check if audio is paused."""
@@ -1,16 +1,62 @@
 """Cross-platform dialog system - uses native dialogs on Mac, tkinter on Windows/Linux."""
+import json
 import sys
 import subprocess
 import platform
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
 
 IS_MAC = platform.system() == 'Darwin'
 IS_WINDOWS = platform.system() == 'Windows'
 
+NSAppleScript = None
+NSPasteboard = None
+if IS_MAC:
+    try:
+        from Foundation import NSAppleScript
+    except ImportError:
+        pass
+    try:
+        from AppKit import NSPasteboard, NSPasteboardTypeString
+    except ImportError:
+        pass
+
 
 # === macOS Implementation (AppleScript) ===
 
+@lru_cache(maxsize=32)
+def _compile_applescript(script):
+    """Compile an AppleScript once so repeated dialogs skip the compile step.
+
+    Raises ValueError if the script doesn't compile; lru_cache doesn't keep
+    exceptions, so a failed compile is never reused.
+    """
+    compiled = NSAppleScript.alloc().initWithSource_(script)
+    ok, error = compiled.compileAndReturnError_(None)
+    if not ok:
+        raise ValueError(f"AppleScript did not compile: {error}")
+    return compiled
+
+
 def _run_osascript(script):
     """Run AppleScript and return output."""
+    # Run in-process when PyObjC is available instead of forking osascript
+    # for every dialog. NSAppleScript may only be used from the main thread.
+    if NSAppleScript is not None and threading.current_thread() is threading.main_thread():
+        try:
+            compiled = _compile_applescript(script)
+        except Exception:
+            compiled = None  # let osascript below try it instead
+        if compiled is not None:
+            try:
+                result, _ = compiled.executeAndReturnError_(None)
+                if result is None:
+                    return ""
+                return (result.stringValue() or "").strip()
+            except Exception:
+                return ""
+
     try:
         result = subprocess.run(
             ['osascript', '-e', script],
@@ -22,29 +68,31 @@ def _run_osascript(script):
         return ""
 
 
-def _mac_askopenfilename(title="Open File", filetypes=None):
-    type_list = ""
-    if filetypes:
-        extensions = []
-        for name, pattern in filetypes:
-            for p in pattern.split():
-                ext = p.replace("*.", "").replace("*", "")
-                if ext:
-                    extensions.append(f'"{ext}"')
-        if extensions:
-            type_list = "{" + ", ".join(extensions) + "}"
-
-    if type_list:
-        script = f'''
+@lru_cache(maxsize=32)
+def _open_script(title, filetypes):
+    """Build the choose-file script; filetypes is a tuple of (name, pattern) pairs."""
+    extensions = []
+    for name, pattern in filetypes:
+        for p in pattern.split():
+            ext = p.replace("*.", "").replace("*", "")
+            if ext:
+                extensions.append(f'"{ext}"')
+
+    if extensions:
+        type_list = "{" + ", ".join(extensions) + "}"
+        return f'''
         set theFile to choose file with prompt "{title}" of type {type_list}
         return POSIX path of theFile
         '''
-    else:
-        script = f'''
+    return f'''
         set theFile to choose file with prompt "{title}"
         return POSIX path of theFile
         '''
-    return _run_osascript(script)
+
+
+def _mac_askopenfilename(title="Open File", filetypes=None):
+    key = tuple((name, pattern) for name, pattern in filetypes) if filetypes else ()
+    return _run_osascript(_open_script(title, key))
 
 
 def _mac_asksaveasfilename(title="Save File", defaultextension="", initialfile=""):
@@ -92,6 +140,10 @@ def _mac_showerror(title, message):
 
 
 def _mac_get_clipboard():
+    if NSPasteboard is not None:
+        # Read the pasteboard in-process instead of spawning pbpaste
+        text = NSPasteboard.generalPasteboard().stringForType_(NSPasteboardTypeString)
+        return str(text) if text is not None else ""
     try:
         result = subprocess.run(['pbpaste'], capture_output=True, text=True)
         return result.stdout
@@ -113,18 +165,20 @@ def _mac_askchoice(title, prompt, options):
     return result if result else None
 
 
-def _mac_asktextarea(title, prompt, default=""):
-    import tempfile
-    import os
-
-    script = '''
+# Run in a separate interpreter: pygame/SDL already owns the Cocoa app in
+# this process, so Tk can't be started here. Parameters arrive as JSON on
+# stdin and the result leaves as JSON on stdout, so no quoting is needed.
+_MAC_TEXTAREA_SCRIPT = '''
+import json
+import sys
 import tkinter as tk
 from tkinter import scrolledtext
-import sys
+
+params = json.load(sys.stdin)
 
 def on_ok():
     text = text_area.get("1.0", tk.END).strip()
-    print(text)
+    sys.stdout.write(json.dumps(text))
     root.destroy()
 
 def on_cancel():
@@ -132,15 +186,15 @@ def on_cancel():
     sys.exit(1)
 
 root = tk.Tk()
-root.title("{title}")
+root.title(params["title"])
 root.geometry("600x400")
 
-label = tk.Label(root, text="{prompt}")
+label = tk.Label(root, text=params["prompt"])
 label.pack(pady=(10, 5))
 
 text_area = scrolledtext.ScrolledText(root, wrap=tk.WORD, width=70, height=20)
 text_area.pack(padx=10, pady=5, fill=tk.BOTH, expand=True)
-text_area.insert("1.0", """{default}""")
+text_area.insert("1.0", params["default"])
 text_area.focus()
 
 button_frame = tk.Frame(root)
@@ -156,35 +210,57 @@ root.bind('<Command-Return>', lambda e: on_ok())
 root.bind('<Escape>', lambda e: on_cancel())
 
 root.mainloop()
-'''.format(title=title.replace('"', '\\"'),
-           prompt=prompt.replace('"', '\\"'),
-           default=default.replace('\\', '\\\\').replace('"', '\\"'))
+'''
 
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-        f.write(script)
-        script_path = f.name
 
+def _mac_asktextarea(title, prompt, default=""):
+    params = json.dumps({"title": title, "prompt": prompt, "default": default})
     try:
         result = subprocess.run(
-            [sys.executable, script_path],
+            [sys.executable, '-c', _MAC_TEXTAREA_SCRIPT],
+            input=params,
             capture_output=True,
             text=True
         )
-        if result.returncode == 0:
-            return result.stdout
+        if result.returncode == 0 and result.stdout:
+            return json.loads(result.stdout)
+        return None
+    except Exception:
         return None
-    finally:
-        os.unlink(script_path)
 
 
 # === Windows/Linux Implementation (tkinter) ===
 
-def _tk_askopenfilename(title="Open File", filetypes=None):
+# Tcl interpreters are bound to the thread that created them; keeping the root
+# thread-local also lets it be torn down on that thread when it exits.
+_tk_local = threading.local()
+
+
+def _get_tk_root():
+    """Return the shared hidden Tk root, creating it on first use."""
     import tkinter as tk
+    root = getattr(_tk_local, 'root', None)
+    if root is None:
+        root = tk.Tk()
+        root.withdraw()
+        root.attributes('-topmost', True)
+        _tk_local.root = root
+    return root
+
+
+def _raise_window(window):
+    """Bring a dialog Toplevel in front of the pygame window and focus it.
+
+    Toplevels on the shared hidden root aren't raised like a fresh root was.
+    """
+    window.lift()
+    window.attributes('-topmost', True)
+    window.focus_force()
+
+
+def _tk_askopenfilename(title="Open File", filetypes=None):
     from tkinter import filedialog
-    root = tk.Tk()
-    root.withdraw()
-    root.attributes('-topmost', True)
+    root = _get_tk_root()
 
     tk_filetypes = []
     if filetypes:
@@ -193,82 +269,66 @@ def _tk_askopenfilename(title="Open File", filetypes=None):
             tk_filetypes.append((name, exts))
     tk_filetypes.append(("All files", "*.*"))
 
-    path = filedialog.askopenfilename(title=title, filetypes=tk_filetypes)
-    root.destroy()
+    path = filedialog.askopenfilename(title=title, filetypes=tk_filetypes, parent=root)
+    root.update_idletasks()
     return path if path else ""
 
 
 def _tk_asksaveasfilename(title="Save File", defaultextension="", initialfile=""):
-    import tkinter as tk
     from tkinter import filedialog
-    root = tk.Tk()
-    root.withdraw()
-    root.attributes('-topmost', True)
+    root = _get_tk_root()
 
     path = filedialog.asksaveasfilename(
         title=title,
         defaultextension=defaultextension,
-        initialfile=initialfile
+        initialfile=initialfile,
+        parent=root
     )
-    root.destroy()
+    root.update_idletasks()
     return path if path else ""
 
 
 def _tk_askstring(title, prompt):
-    import tkinter as tk
     from tkinter import simpledialog
-    root = tk.Tk()
-    root.withdraw()
-    root.attributes('-topmost', True)
+    root = _get_tk_root()
 
     result = simpledialog.askstring(title, prompt, parent=root)
-    root.destroy()
+    root.update_idletasks()
     return result
 
 
 def _tk_askyesno(title, message):
-    import tkinter as tk
     from tkinter import messagebox
-    root = tk.Tk()
-    root.withdraw()
-    root.attributes('-topmost', True)
+    root = _get_tk_root()
 
     result = messagebox.askyesno(title, message, parent=root)
-    root.destroy()
+    root.update_idletasks()
     return result
 
 
 def _tk_showinfo(title, message):
-    import tkinter as tk
     from tkinter import messagebox
-    root = tk.Tk()
-    root.withdraw()
-    root.attributes('-topmost', True)
+    root = _get_tk_root()
 
     messagebox.showinfo(title, message, parent=root)
-    root.destroy()
+    root.update_idletasks()
 
 
 def _tk_showerror(title, message):
-    import tkinter as tk
     from tkinter import messagebox
-    root = tk.Tk()
-    root.withdraw()
-    root.attributes('-topmost', True)
+    root = _get_tk_root()
 
     messagebox.showerror(title, message, parent=root)
-    root.destroy()
+    root.update_idletasks()
 
 
 def _tk_get_clipboard():
     import tkinter as tk
-    root = tk.Tk()
-    root.withdraw()
+    root = _get_tk_root()
     try:
         text = root.clipboard_get()
     except tk.TclError:
         text = ""
-    root.destroy()
     return text
 
 
@@ -281,26 +341,26 @@ def _tk_askchoice(title, prompt, options):
         selection = listbox.curselection()
         if selection:
             result[0] = options[selection[0]]
-        root.destroy()
+        window.destroy()
 
     def on_cancel():
-        root.destroy()
+        window.destroy()
 
-    root = tk.Tk()
-    root.title(title)
-    root.attributes('-topmost', True)
-    root.geometry("300x250")
+    root = _get_tk_root()
+    window = tk.Toplevel(root)
+    window.title(title)
+    window.geometry("300x250")
 
-    label = tk.Label(root, text=prompt)
+    label = tk.Label(window, text=prompt)
     label.pack(pady=(10, 5))
 
-    listbox = tk.Listbox(root, selectmode=tk.SINGLE, height=len(options))
+    listbox = tk.Listbox(window, selectmode=tk.SINGLE, height=len(options))
     for opt in options:
         listbox.insert(tk.END, opt)
     listbox.selection_set(0)
     listbox.pack(padx=20, pady=5, fill=tk.BOTH, expand=True)
 
-    btn_frame = tk.Frame(root)
+    btn_frame = tk.Frame(window)
     btn_frame.pack(pady=10)
 
     ok_btn = tk.Button(btn_frame, text="OK", command=on_select, width=10)
@@ -310,10 +370,11 @@ def _tk_askchoice(title, prompt, options):
     cancel_btn.pack(side=tk.LEFT, padx=5)
 
     listbox.bind('<Double-1>', lambda e: on_select())
-    root.bind('<Return>', lambda e: on_select())
-    root.bind('<Escape>', lambda e: on_cancel())
+    window.bind('<Return>', lambda e: on_select())
+    window.bind('<Escape>', lambda e: on_cancel())
 
-    root.mainloop()
+    _raise_window(window)
+    root.wait_window(window)
     return result[0]
 
 
@@ -325,25 +386,25 @@ def _tk_asktextarea(title, prompt, default=""):
 
     def on_ok():
         result[0] = text_area.get("1.0", tk.END).strip()
-        root.destroy()
+        window.destroy()
 
     def on_cancel():
-        root.destroy()
+        window.destroy()
 
-    root = tk.Tk()
-    root.title(title)
-    root.attributes('-topmost', True)
-    root.geometry("600x400")
+    root = _get_tk_root()
+    window = tk.Toplevel(root)
+    window.title(title)
+    window.geometry("600x400")
 
-    label = tk.Label(root, text=prompt)
+    label = tk.Label(window, text=prompt)
     label.pack(pady=(10, 5))
 
-    text_area = scrolledtext.ScrolledText(root, wrap=tk.WORD, width=70, height=20)
+    text_area = scrolledtext.ScrolledText(window, wrap=tk.WORD, width=70, height=20)
     text_area.pack(padx=10, pady=5, fill=tk.BOTH, expand=True)
     text_area.insert("1.0", default)
     text_area.focus()
 
-    button_frame = tk.Frame(root)
+    button_frame = tk.Frame(window)
     button_frame.pack(pady=10)
 
     ok_btn = tk.Button(button_frame, text="OK", command=on_ok, width=10)
@@ -352,16 +413,48 @@ def _tk_asktextarea(title, prompt, default=""):
     cancel_btn = tk.Button(button_frame, text="Cancel", command=on_cancel, width=10)
     cancel_btn.pack(side=tk.LEFT, padx=5)
 
-    root.bind('<Control-Return>', lambda e: on_ok())
-    root.bind('<Escape>', lambda e: on_cancel())
+    window.bind('<Control-Return>', lambda e: on_ok())
+    window.bind('<Escape>', lambda e: on_cancel())
 
-    root.mainloop()
+    _raise_window(window)
+    text_area.focus()  # focus_force() moved focus to the window itself
+    root.wait_window(window)
     return result[0]
 
 
+# === Dialog thread ===
+
+# A single worker serializes dialogs: queued dialogs appear one after another,
+# and the shared Tk root is only ever touched from this thread.
+_dialog_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dialogs")
+
+
+def _async(func):
+    """Wrap a dialog so it runs on the dialog thread and returns a Future."""
+    @wraps(func)
+    def submit(*args, **kwargs):
+        return _dialog_executor.submit(func, *args, **kwargs)
+    return submit
+
+
+def _blocking(func):
+    """Wrap a dialog so it runs on the dialog thread and waits for its result."""
+    submit = _async(func)
+
+    @wraps(func)
+    def call(*args, **kwargs):
+        return submit(*args, **kwargs).result()
+    return call
+
+
 # === Public API (auto-selects implementation) ===
 
+# The plain functions block until the dialog is closed. The *_async variants
+# return a concurrent.futures.Future immediately, so several dialogs can be
+# queued and reaped later with concurrent.futures.wait().
 if IS_MAC:
+    # Blocking calls stay on the caller's (main) thread so NSAppleScript can
+    # run in-process; queued dialogs fall back to osascript.
     askopenfilename = _mac_askopenfilename
     asksaveasfilename = _mac_asksaveasfilename
     askstring = _mac_askstring
@@ -371,13 +464,31 @@ if IS_MAC:
     get_clipboard = _mac_get_clipboard
     askchoice = _mac_askchoice
     asktextarea = _mac_asktextarea
+
+    askopenfilename_async = _async(_mac_askopenfilename)
+    asksaveasfilename_async = _async(_mac_asksaveasfilename)
+    askstring_async = _async(_mac_askstring)
+    askyesno_async = _async(_mac_askyesno)
+    showinfo_async = _async(_mac_showinfo)
+    showerror_async = _async(_mac_showerror)
+    askchoice_async = _async(_mac_askchoice)
+    asktextarea_async = _async(_mac_asktextarea)
 else:
-    askopenfilename = _tk_askopenfilename
-    asksaveasfilename = _tk_asksaveasfilename
-    askstring = _tk_askstring
-    askyesno = _tk_askyesno
-    showinfo = _tk_showinfo
-    showerror = _tk_showerror
-    get_clipboard = _tk_get_clipboard
-    askchoice = _tk_askchoice
-    asktextarea = _tk_asktextarea
+    askopenfilename = _blocking(_tk_askopenfilename)
+    asksaveasfilename = _blocking(_tk_asksaveasfilename)
+    askstring = _blocking(_tk_askstring)
+    askyesno = _blocking(_tk_askyesno)
+    showinfo = _blocking(_tk_showinfo)
+    showerror = _blocking(_tk_showerror)
+    get_clipboard = _blocking(_tk_get_clipboard)
+    askchoice = _blocking(_tk_askchoice)
+    asktextarea = _blocking(_tk_asktextarea)
+
+    askopenfilename_async = _async(_tk_askopenfilename)
+    asksaveasfilename_async = _async(_tk_asksaveasfilename)
+    askstring_async = _async(_tk_askstring)
+    askyesno_async = _async(_tk_askyesno)
+    showinfo_async = _async(_tk_showinfo)
+    showerror_async = _async(_tk_showerror)
+    askchoice_async = _async(_tk_askchoice)
+    asktextarea_async = _async(_tk_asktextarea)
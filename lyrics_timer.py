@@ -1,11 +1,16 @@
 """Lyrics timing data model and management."""
-import json
 import re
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Optional, cast
 
+import numpy as np
 
-@dataclass
+from utils import read_json, write_json
+
+_WORD_RE = re.compile(r'\S+')
+
+
+@dataclass(slots=True)
 class TimedWord:
     """A word with its timing information."""
     word: str
@@ -13,12 +18,54 @@ class TimedWord:
     index: int = 0  # Position in the word list
 
 
-@dataclass
+@dataclass(slots=True)
 class TimedLine:
     """A line of lyrics with timing information."""
-    text: str
+    words: list[TimedWord] = field(default_factory=list)
     start_time: Optional[float] = None
     index: int = 0
+    _text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def text(self) -> str:
+        """The line's words joined with spaces (built on first access)."""
+        if self._text is None:
+            self._text = ' '.join(w.word for w in self.words)
+        return self._text
+
+
+def _find_untimed(words: list[TimedWord], start: int) -> int:
+    """Index of the first untimed word at or after start (len(words) if none)."""
+    i = start
+    n = len(words)
+    while i < n and (words[i].word == '\n' or words[i].start_time is not None):
+        i += 1
+    return i
+
+
+def _start_times(words: list[TimedWord]) -> np.ndarray:
+    """Start time of every entry in words as float64 (NaN for untimed words and line breaks)."""
+    return np.fromiter(
+        (w.start_time if w.start_time is not None and w.word != '\n' else np.nan for w in words),
+        dtype=np.float64, count=len(words))
+
+
+def _split_lines(words: list[TimedWord]) -> list[list[TimedWord]]:
+    """Group words into lines at the line breaks, dropping empty lines."""
+    lines: list[list[TimedWord]] = []
+    current_line: list[TimedWord] = []
+
+    for word in words:
+        if word.word == '\n':
+            if current_line:
+                lines.append(current_line)
+                current_line = []
+        else:
+            current_line.append(word)
+
+    if current_line:
+        lines.append(current_line)
+    return lines
 
 
 @dataclass
@@ -27,62 +74,91 @@ class LyricsTimer:
     words: list[TimedWord] = field(default_factory=list)
     current_index: int = 0  # Next word to be timed
 
-    def load_lyrics(self, text: str):
-        """Parse lyrics text into words."""
-        # Split on whitespace, preserving line structure for display
-        self.words = []
+    def __post_init__(self) -> None:
+        self._invalidate()
+        self._recount()
+
+    def _invalidate(self) -> None:
+        """Drop cached lines and timing lookups after words or timings change."""
+        self._lines_cache: Optional[list[list[TimedWord]]] = None
+        self._visible_lines_cache: Optional[list[TimedLine]] = None
+        # (suffix-min start times, line indices) for searchsorted
+        self._line_times: Optional[tuple[np.ndarray, list[int]]] = None
+        # (running-max start times, indices of the timed words) for searchsorted
+        self._word_times: Optional[tuple[np.ndarray, np.ndarray]] = None
+
+    def _recount(self) -> None:
+        """Recompute the word counters from scratch after the word list is replaced."""
+        self._n_words_total: int = sum(1 for w in self.words if w.word != '\n')
+        self._n_words_timed: int = sum(1 for w in self.words if w.word != '\n' and w.start_time is not None)
+        self._next_untimed: int = _find_untimed(self.words, 0)
+        # Array mirror of every word's start_time, kept in sync by the mutators
+        # so timing lookups are rebuilt with vectorized ops
+        self._start_times: np.ndarray = _start_times(self.words)
+
+    def set_words(self, words: list[TimedWord]) -> None:
+        """Replace the word list (e.g. when opening a project)."""
+        self.words = words
+        self._invalidate()
+        self._recount()
+        self.current_index = self.get_next_untimed_index()
+
+    def set_word_dicts(self, entries: list[dict]) -> None:
+        """Replace the word list from saved {'word', 'start_time', 'index'} dicts."""
+        # Positional args: keyword parsing is a measurable share of large loads
+        self.set_words([TimedWord(e['word'], e['start_time'], e['index']) for e in entries])
+
+    def reset_timings(self) -> None:
+        """Clear the timestamp of every word."""
+        for word in self.words:
+            word.start_time = None
         self.current_index = 0
+        self._n_words_timed = 0
+        self._next_untimed = _find_untimed(self.words, 0)
+        self._start_times.fill(np.nan)
+        self._invalidate()
 
-        # Split into words, keeping track of line breaks
-        lines = text.split('\n')
-        word_index = 0
-
-        for line in lines:
-            line_words = re.findall(r'\S+', line)
-            if line_words:
-                # Line has words
-                for word in line_words:
-                    self.words.append(TimedWord(word=word, index=word_index))
-                    word_index += 1
-                # Add line break after words
-                self.words.append(TimedWord(word='\n', index=word_index))
-                word_index += 1
-            else:
-                # Empty line (verse break) - add blank line marker
-                self.words.append(TimedWord(word='\n', index=word_index))
-                word_index += 1
+    def load_lyrics(self, text: str) -> None:
+        """Parse lyrics text into words."""
+        # Split on whitespace, preserving line structure for display.
+        # Every line contributes its words followed by a line break; an
+        # empty line (verse break) contributes just the break.
+        tokens = []
+        for line in text.split('\n'):
+            tokens.extend(_WORD_RE.findall(line))
+            tokens.append('\n')
 
         # Remove trailing line breaks
-        while self.words and self.words[-1].word == '\n':
-            self.words.pop()
-
-    def get_lines(self) -> list[list[TimedWord]]:
-        """Get words organized by lines for display."""
-        lines = []
-        current_line = []
-
-        for word in self.words:
-            if word.word == '\n':
-                if current_line:
-                    lines.append(current_line)
-                    current_line = []
-            else:
-                current_line.append(word)
+        while tokens and tokens[-1] == '\n':
+            tokens.pop()
 
-        if current_line:
-            lines.append(current_line)
+        self.words = [TimedWord(word=word, index=i) for i, word in enumerate(tokens)]
+        self.current_index = 0
+        self._n_words_total = sum(1 for word in tokens if word != '\n')
+        self._n_words_timed = 0
+        self._next_untimed = _find_untimed(self.words, 0)
+        self._start_times = np.full(len(self.words), np.nan)
+        self._invalidate()
 
-        return lines
+    def get_lines(self) -> list[list[TimedWord]]:
+        """Get words organized by lines for display (cached, do not mutate)."""
+        if self._lines_cache is None:
+            self._lines_cache = _split_lines(self.words)
+        return self._lines_cache
 
     def mark_word(self, timestamp: float) -> bool:
         """Mark the next untimed word with the given timestamp. Returns True if successful."""
-        # Find the next untimed word
-        for i, word in enumerate(self.words):
-            if word.word != '\n' and word.start_time is None:
-                word.start_time = timestamp
-                self.current_index = i + 1
-                return True
-        return False
+        # Everything before the pointer is timed, so this is the next untimed word
+        i = self._next_untimed
+        if i >= len(self.words):
+            return False
+        self.words[i].start_time = timestamp
+        self._start_times[i] = timestamp
+        self.current_index = i + 1
+        self._n_words_timed += 1
+        self._next_untimed = _find_untimed(self.words, i + 1)
+        self._invalidate()
+        return True
 
     def unmark_last(self) -> bool:
         """Remove timing from the last timed word. Returns True if successful."""
@@ -90,68 +166,89 @@ class LyricsTimer:
         for i in range(len(self.words) - 1, -1, -1):
             if self.words[i].word != '\n' and self.words[i].start_time is not None:
                 self.words[i].start_time = None
+                self._start_times[i] = np.nan
                 self.current_index = i
+                self._n_words_timed -= 1
+                self._next_untimed = min(self._next_untimed, i)
+                self._invalidate()
                 return True
         return False
 
     def get_next_untimed_index(self) -> int:
         """Get the index of the next word to be timed."""
-        for i, word in enumerate(self.words):
-            if word.word != '\n' and word.start_time is None:
-                return i
-        return len(self.words)
+        return self._next_untimed
 
     def get_timed_count(self) -> int:
         """Get the number of timed words."""
-        return sum(1 for w in self.words if w.word != '\n' and w.start_time is not None)
+        return self._n_words_timed
 
     def get_total_words(self) -> int:
         """Get total number of words (excluding line breaks)."""
-        return sum(1 for w in self.words if w.word != '\n')
+        return self._n_words_total
 
     def is_complete(self) -> bool:
         """Check if all words have been timed."""
-        return self.get_timed_count() == self.get_total_words()
+        return self._n_words_timed == self._n_words_total
 
     def get_word_at_time(self, time: float) -> tuple[Optional[TimedWord], float]:
         """
         Get the word being sung at the given time.
         Returns (word, progress) where progress is 0-1 for fill animation.
         """
-        current_word = None
-        next_time = None
-
-        # Find the current word (last word with start_time <= time)
-        for i, word in enumerate(self.words):
-            if word.word == '\n' or word.start_time is None:
-                continue
-            if word.start_time <= time:
-                current_word = word
-                # Find next timed word for progress calculation
-                for j in range(i + 1, len(self.words)):
-                    if self.words[j].word != '\n' and self.words[j].start_time is not None:
-                        next_time = self.words[j].start_time
-                        break
-            else:
-                break
+        times, timed_indices = self._get_word_times()
 
-        if current_word is None:
+        # Current word is the last one before the first timed word that
+        # starts after `time`; the running max keeps the search exact even
+        # if words were timed out of order.
+        if not len(times) or time < times[0]:
+            # Before the first lyric (or nothing timed yet)
             return None, 0.0
+        if time >= times[-1]:
+            # After the last lyric started
+            i = len(timed_indices) - 1
+        else:
+            i = int(np.searchsorted(times, time, side='right')) - 1
+        return self._word_progress(i, time)
+
+    def get_words_at_times(self, times: list[float]) -> list[tuple[Optional[TimedWord], float]]:
+        """get_word_at_time() for several times, with a single search for all of them."""
+        word_times, _ = self._get_word_times()
+        if not len(word_times):
+            return [(None, 0.0) for _ in times]
+        positions = np.searchsorted(word_times, times, side='right') - 1
+        return [self._word_progress(i, time) if i >= 0 else (None, 0.0)
+                for i, time in zip(positions.tolist(), times)]
+
+    def _word_progress(self, i: int, time: float) -> tuple[TimedWord, float]:
+        """(word, fill progress) for the i-th timed word at the given time."""
+        timed_indices = self._get_word_times()[1]
+        current_word = self.words[int(timed_indices[i])]
+        start = cast(float, current_word.start_time)  # timed words always have one
+        next_time = (float(self._start_times[timed_indices[i + 1]])
+                     if i + 1 < len(timed_indices) else None)
 
         # Calculate progress within the word
         if next_time is not None:
-            word_duration = next_time - current_word.start_time
+            word_duration = next_time - start
             if word_duration > 0:
-                progress = min(1.0, (time - current_word.start_time) / word_duration)
+                progress = min(1.0, (time - start) / word_duration)
             else:
                 progress = 1.0
         else:
             # Last word - assume 1 second duration
-            progress = min(1.0, (time - current_word.start_time) / 1.0)
+            progress = min(1.0, (time - start) / 1.0)
 
         return current_word, progress
 
-    def save(self, file_path: str):
+    def _get_word_times(self) -> tuple[np.ndarray, np.ndarray]:
+        """Indices of the timed words in order, with the running max of their start times."""
+        if self._word_times is None:
+            timed_indices = np.flatnonzero(~np.isnan(self._start_times))
+            times = self._start_times[timed_indices]
+            self._word_times = (np.maximum.accumulate(times), timed_indices)
+        return self._word_times
+
+    def save(self, file_path: str) -> None:
         """Save timing data to JSON file."""
         data = {
             'words': [
@@ -159,19 +256,13 @@ class LyricsTimer:
                 for w in self.words
             ]
         }
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        write_json(file_path, data)
 
     def load(self, file_path: str) -> bool:
         """Load timing data from JSON file. Returns True on success."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            self.words = [
-                TimedWord(word=w['word'], start_time=w['start_time'], index=w['index'])
-                for w in data['words']
-            ]
-            self.current_index = self.get_next_untimed_index()
+            data = read_json(file_path)
+            self.set_word_dicts(data['words'])
             return True
         except Exception as e:
             print(f"Error loading timing data: {e}")
@@ -179,55 +270,39 @@ class LyricsTimer:
 
     def get_lyrics_text(self) -> str:
         """Reconstruct the lyrics text from words."""
-        result = []
-        prev_was_newline = False
+        # Words are joined with spaces within a line; each line break
+        # (including blank verse-break lines) starts a new line.
+        lines: list[list[str]] = [[]]
         for word in self.words:
             if word.word == '\n':
-                # Remove trailing space before newline
-                if result and result[-1].endswith(' '):
-                    result[-1] = result[-1].rstrip()
-                result.append('\n')
-                prev_was_newline = True
+                lines.append([])
             else:
-                result.append(word.word + ' ')
-                prev_was_newline = False
-        return ''.join(result).strip()
+                lines[-1].append(word.word)
+        return '\n'.join(' '.join(line) for line in lines).strip()
 
     def get_visible_lines(self) -> list[TimedLine]:
-        """Get lyrics as lines for video rendering."""
-        lines = []
-        current_line_words = []
-        line_index = 0
-
-        for word in self.words:
-            if word.word == '\n':
-                if current_line_words:
-                    # Create line from accumulated words
-                    text = ' '.join(w.word for w in current_line_words)
-                    start_time = current_line_words[0].start_time
-                    lines.append(TimedLine(text=text, start_time=start_time, index=line_index))
-                    line_index += 1
-                    current_line_words = []
-            else:
-                current_line_words.append(word)
-
-        # Don't forget the last line
-        if current_line_words:
-            text = ' '.join(w.word for w in current_line_words)
-            start_time = current_line_words[0].start_time
-            lines.append(TimedLine(text=text, start_time=start_time, index=line_index))
-
-        return lines
+        """Get lyrics as lines for video rendering (cached, do not mutate)."""
+        if self._visible_lines_cache is None:
+            # Same grouping as get_lines(); each line shares its word list
+            self._visible_lines_cache = [
+                TimedLine(words=line_words, start_time=line_words[0].start_time, index=i)
+                for i, line_words in enumerate(self.get_lines())
+            ]
+        return self._visible_lines_cache
 
     def get_line_at_time(self, time: float) -> tuple[Optional[TimedLine], int]:
         """Get the line being sung at the given time."""
         lines = self.get_visible_lines()
-        current_line = None
-        current_idx = -1
-
-        for i, line in enumerate(lines):
-            if line.start_time is not None and line.start_time <= time:
-                current_line = line
-                current_idx = i
-
-        return current_line, current_idx
+        if self._line_times is None:
+            timed = [(line.start_time, i) for i, line in enumerate(lines) if line.start_time is not None]
+            times = np.array([t for t, _ in timed], dtype=np.float64)
+            # Suffix min so the search finds the last line starting at or before `time`
+            mins = np.minimum.accumulate(times[::-1])[::-1]
+            self._line_times = (mins, [i for _, i in timed])
+
+        mins, line_indices = self._line_times
+        i = int(np.searchsorted(mins, time, side='right')) - 1
+        if i < 0:
+            return None, -1
+        current_idx = line_indices[i]
+        return lines[current_idx], current_idx
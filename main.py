@@ -18,6 +18,7 @@ Controls:
 
 Or use the buttons!
 """
+import bisect
 import copy
 import math
 import os
@@ -26,14 +27,19 @@ import platform
 import threading
 import time as _time
 import webbrowser
+from collections import OrderedDict
+from functools import lru_cache
 
-from utils import resource_path
+import numpy as np
+
+from utils import resource_path, read_json, write_json
 
 
 # Set app name and icon for macOS (must be before pygame import)
 APP_NAME = "FREE Lyric Video Creator"
 IS_MAC = platform.system() == 'Darwin'
 IS_WINDOWS = platform.system() == 'Windows'
+MOD_KEY = "Cmd" if IS_MAC else "Ctrl"  # shortcut modifier as shown in hints
 
 if IS_MAC:
     try:
@@ -64,10 +70,108 @@ from pygame import K_SPACE, K_DELETE, K_BACKSPACE
 from pygame import K_RETURN, K_HOME, K_END, K_UP, K_DOWN
 from pygame import K_a, K_p, K_s, K_LEFT, K_RIGHT, K_e, K_l, K_t, K_v, K_j, K_k, K_r, K_ESCAPE
 
-from audio_player import AudioPlayer
+from audio_player import AudioPlayer, MUSIC_END_EVENT, pre_init_mixer
 from lyrics_timer import LyricsTimer
 from video_renderer import VideoRenderer, RenderCancelled, render_preview_frame, RESOLUTIONS
 
+# Posted by pygame's timer when the current status message should disappear
+STATUS_EXPIRY_EVENT = pygame.USEREVENT + 2
+# Posted every CURSOR_BLINK_MS while the lyrics editor is open
+CURSOR_BLINK_EVENT = pygame.USEREVENT + 3
+CURSOR_BLINK_MS = 500
+
+# Input the app never handles; blocked so it doesn't fill the queue or
+# wake the idle loop (window events stay allowed for resize and expose)
+UNUSED_EVENT_TYPES = (
+    pygame.KEYUP, pygame.MOUSEWHEEL, pygame.TEXTEDITING,
+    pygame.JOYAXISMOTION, pygame.JOYBALLMOTION, pygame.JOYHATMOTION,
+    pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP,
+    pygame.CONTROLLERAXISMOTION, pygame.CONTROLLERBUTTONDOWN, pygame.CONTROLLERBUTTONUP,
+    pygame.FINGERMOTION, pygame.FINGERDOWN, pygame.FINGERUP, pygame.MULTIGESTURE,
+)
+
+# Still handled while a modal dialog is up: quit, timers, and the window
+# events that keep the layout and the presented frame in step with the window
+DIALOG_PASSTHROUGH_EVENTS = (
+    QUIT, MUSIC_END_EVENT, STATUS_EXPIRY_EVENT,
+    VIDEORESIZE, pygame.WINDOWSIZECHANGED, pygame.WINDOWEXPOSED,
+)
+
+
+@lru_cache(maxsize=4096)
+def _prefix_widths(font, line):
+    """Pixel x offset of every caret position in line: widths[i] = width of line[:i]."""
+    return (0,) + tuple(font.size(line[:i])[0] for i in range(1, len(line) + 1))
+
+
+@lru_cache(maxsize=4096)
+def _caret_midpoints(font, line):
+    """Midpoint x of every character in line, for mapping a click to a caret position."""
+    widths = _prefix_widths(font, line)
+    return tuple((widths[i] + widths[i + 1]) / 2 for i in range(len(line)))
+
+
+@lru_cache(maxsize=4096)
+def _wrap_paragraph(font, paragraph, max_width):
+    """Greedy word-wrap one newline-free paragraph; ((offset in paragraph, line), ...)."""
+    if not paragraph:
+        return ((0, ''),)
+
+    wrapped = []
+    current = ''
+    line_offset = 0  # where this wrapped line starts in the paragraph
+
+    for word in paragraph.split(' '):
+        test = (current + ' ' + word) if current else word
+        test_width = font.size(test)[0]
+
+        if test_width > max_width and current:
+            # Emit the current wrapped line
+            wrapped.append((line_offset, current))
+            line_offset += len(current) + 1  # +1 for the space
+            current = word
+        else:
+            current = test
+
+    # Emit remaining text in paragraph
+    wrapped.append((line_offset, current))
+    return tuple(wrapped)
+
+
+@lru_cache(maxsize=None)
+def _ui_font_paths():
+    """(regular, bold) TTF paths for the UI font; match_font scans the system font list."""
+    regular = pygame.font.match_font('arial') or pygame.font.match_font('helvetica')
+    bold = pygame.font.match_font('arial', bold=True) or pygame.font.match_font('helvetica', bold=True) or regular
+    return regular, bold
+
+
+@lru_cache(maxsize=None)
+def _font(path, size):
+    """Shared Font instance per (path, size), so font-keyed caches stay valid across uses."""
+    return pygame.font.Font(path, size)
+
+
+@lru_cache(maxsize=64)
+def _highlight_pill(width, height):
+    """Semi-transparent gold pill drawn behind the current lyric word."""
+    pill = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.rect(pill, (255, 215, 0, 35), (0, 0, width, height), border_radius=6)
+    return pill
+
+
+@lru_cache(maxsize=None)
+def _load_app_icon():
+    """Load the window icon once (try BMP first for Python 3.14 pygame compatibility)."""
+    for icon_name in ['icon.bmp', 'icon.png']:
+        icon_path = resource_path(icon_name)
+        if os.path.exists(icon_path):
+            try:
+                return pygame.image.load(icon_path)
+            except pygame.error:
+                continue
+    return None
+
 
 class Button:
     """Simple clickable button."""
@@ -78,17 +182,23 @@ class Button:
         self.color = color
         self.hover_color = hover_color
         self.is_hovered = False
+        self._text_surface = None
+        self._text_key = None  # (text, font) the cached surface was rendered for
 
-    def draw(self, screen, font):
+    def draw(self, screen, font, offset=(0, 0)):
+        """Draw onto screen; offset is the screen position of screen's top-left corner."""
         color = self.hover_color if self.is_hovered else self.color
-        pygame.draw.rect(screen, color, self.rect, border_radius=5)
-        pygame.draw.rect(screen, (100, 100, 100), self.rect, 1, border_radius=5)
-
-        # Text
-        text_color = (250, 250, 250)
-        text_surface = font.render(self.text, True, text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        rect = self.rect.move(-offset[0], -offset[1])
+        pygame.draw.rect(screen, color, rect, border_radius=5)
+        pygame.draw.rect(screen, (100, 100, 100), rect, 1, border_radius=5)
+
+        # Text (rendered once, re-rendered only if the label or font changes)
+        if self._text_key != (self.text, font):
+            text_color = (250, 250, 250)
+            self._text_surface = font.render(self.text, True, text_color).convert_alpha()
+            self._text_key = (self.text, font)
+        text_rect = self._text_surface.get_rect(center=rect.center)
+        screen.blit(self._text_surface, text_rect)
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
@@ -119,46 +229,52 @@ class LyricVideoCreator:
     LINE_HEIGHT = 36
     BUTTON_PANEL_WIDTH = 160
 
+    # Choices offered by export_video(); the first word is the RESOLUTIONS key
+    EXPORT_RESOLUTION_CHOICES = ("1080p (1920x1080)", "720p (1280x720)", "480p (854x480)")
+
+    # Keyboard hints (status bar and inline editor)
+    IDLE_HINT = "SPACE=mark | DEL=unmark | P=play/pause | Arrow keys=seek"
+    EDITING_HINT = f"EDITING — {MOD_KEY}+Enter=save | ESC=cancel | {MOD_KEY}+V=paste"
+    EDITOR_BUTTONS_HINT = f"{MOD_KEY}+Enter = save  |  ESC = cancel"
+
+    # Memory budget for cached lyric word surfaces (least recently used go first)
+    WORD_CACHE_BYTES = 4 * 1024 * 1024
+
     def __init__(self, initial_file=None):
+        pre_init_mixer()
         pygame.init()
         pygame.display.set_caption("FREE Lyric Video Creator")
 
-        # Set dock/window icon (try BMP first for Python 3.14 pygame compatibility)
-        for icon_name in ['icon.bmp', 'icon.png']:
-            icon_path = resource_path(icon_name)
-            if os.path.exists(icon_path):
-                try:
-                    icon = pygame.image.load(icon_path)
-                    pygame.display.set_icon(icon)
-                    break
-                except pygame.error:
-                    continue
+        # Set dock/window icon
+        icon = _load_app_icon()
+        if icon is not None:
+            pygame.display.set_icon(icon)
 
         self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT), pygame.RESIZABLE)
         self.clock = pygame.time.Clock()
+        pygame.event.set_blocked(UNUSED_EVENT_TYPES)
 
         self.audio = AudioPlayer()
         self.lyrics = LyricsTimer()
 
-        _font_path = pygame.font.match_font('arial') or pygame.font.match_font('helvetica')
-        _font_path_bold = pygame.font.match_font('arial', bold=True) or pygame.font.match_font('helvetica', bold=True) or _font_path
-        if _font_path:
-            self.font = pygame.font.Font(_font_path, 24)
-            self.small_font = pygame.font.Font(_font_path, 16)
-            self.title_font = pygame.font.Font(_font_path_bold, 28)
-            self.button_font = pygame.font.Font(_font_path, 14)
-            self.label_font = pygame.font.Font(_font_path_bold, 11)
-        else:
-            self.font = pygame.font.Font(None, 24)
-            self.small_font = pygame.font.Font(None, 16)
-            self.title_font = pygame.font.Font(None, 28)
-            self.button_font = pygame.font.Font(None, 14)
-            self.label_font = pygame.font.Font(None, 11)
+        # Falls back to pygame's default font (path None) if neither is installed
+        _font_path, _font_path_bold = _ui_font_paths()
+        self.font = _font(_font_path, 24)
+        self.small_font = _font(_font_path, 16)
+        self.title_font = _font(_font_path_bold, 28)
+        self.button_font = _font(_font_path, 14)
+        self.label_font = _font(_font_path_bold, 11)
 
         self.audio_file = None
         self.running = True
         self.status_message = "Load audio and lyrics to get started"
-        self.status_time = 0
+        self._status_surface = None  # status_message rendered by set_status()
+        self._stats_cache = (None, None)  # (stats text, rendered surface)
+        self._time_cache = (None, None, None)  # (clock text, colour, rendered surface)
+        self._text_cache = {}  # (font, text, color) -> surface, see _render_text()
+        self._word_surface_cache = OrderedDict()  # (word, color) -> surface, see _render_word()
+        self._word_surface_bytes = 0
+        self._word_surface_words = None  # lyrics word list the cache was filled for
 
         # Inline lyrics editor state
         self.editing = False
@@ -168,18 +284,43 @@ class LyricVideoCreator:
         self.edit_saved_lyrics = ""
         self.edit_sel_start = None  # None = no selection, int = anchor position
         self.edit_last_click_time = 0  # for double-click detection
+        self._blink_on = True  # caret phase, flipped by CURSOR_BLINK_EVENT
         self._edit_dragging = False
         self._edit_drag_origin = 0
         self.edit_buttons = []
+        # Caret movement keys for _handle_edit_key (Shift+key extends the selection)
+        self._edit_moves = {
+            K_LEFT: self._caret_left,
+            K_RIGHT: self._caret_right,
+            K_UP: lambda: self._editor_move_vertical(-1),
+            K_DOWN: lambda: self._editor_move_vertical(1),
+            K_HOME: self._caret_line_start,
+            K_END: self._caret_line_end,
+        }
+
+        # Redraw tracking: draw() only runs when something may have changed
+        self._dirty = True
+        self._drawn_state = None  # _frame_state() as of the last draw
+        self._button_panel_surface = None
+        self._button_panel_key = None  # (buttons, size, hover states) the panel was drawn for
+        self._panel_divider = None
+        self._presented_panel = None  # panel surface the window last showed in full
+        self._cursor_kind = None  # system cursor last set by _update_cursor()
+        self._buttons_bbox = (None, None)  # (buttons list, union of their rects)
 
         # Smooth scroll state for lyrics display
         self.lyrics_scroll_y = 0.0
+        self._lyrics_layout = None  # (words, content width, result of _layout_lyrics())
+        self._word_widths = (None, None)  # (words, pixel width of each entry), see _get_word_widths()
 
         # Cached wrap results for hit-testing (set by _draw_editor)
         self._edit_lines = ['']
         self._edit_line_starts = [0]
         self._edit_top_y = 0
         self._edit_line_h = 36
+        self._wrap_cache = None  # (edit_text, wrap width, lines, line_starts)
+        self._newline_cache = (None, [])  # (edit_text, offsets of its '\n's)
+        self._editor_layout_cache = None  # ((top_y, width, height), geometry), see _editor_layout()
 
         # Create buttons
         self.buttons = self._create_buttons()
@@ -191,14 +332,14 @@ class LyricVideoCreator:
     def _create_buttons(self):
         """Create all UI buttons."""
         buttons = []
-        self.panel_labels = []  # (label_text, y_position)
+        self.panel_labels = []  # (label_surface, y_position)
         x = self.WIDTH - self.BUTTON_PANEL_WIDTH + 10
         y = 60
         w = self.BUTTON_PANEL_WIDTH - 20
         h = 32
         gap = 8
         # FILE section
-        self.panel_labels.append(("FILE", y - 14))
+        self.panel_labels.append((self._render_text(self.label_font, "FILE", self.DIM_COLOR), y - 14))
         buttons.append(Button(x, y, w, h, "Load Audio (L)", self.load_audio))
         y += h + gap
         buttons.append(Button(x, y, w, h, "Load Lyrics (T)", self.load_lyrics_file))
@@ -209,7 +350,7 @@ class LyricVideoCreator:
         y += h + gap + 14
 
         # PLAYBACK section
-        self.panel_labels.append(("PLAYBACK", y - 14))
+        self.panel_labels.append((self._render_text(self.label_font, "PLAYBACK", self.DIM_COLOR), y - 14))
         buttons.append(Button(x, y, w, h, "Play / Pause (P)", self.toggle_play, color=(50, 80, 50)))
         y += h + gap
         buttons.append(Button(x, y, w, h, "Stop (S)", self.stop_audio))
@@ -219,7 +360,7 @@ class LyricVideoCreator:
         y += h + gap + 14
 
         # TIMING section
-        self.panel_labels.append(("TIMING", y - 14))
+        self.panel_labels.append((self._render_text(self.label_font, "TIMING", self.DIM_COLOR), y - 14))
         buttons.append(Button(x, y, w, h, "Mark Word (SPACE)", self.mark_word, color=(80, 80, 50)))
         y += h + gap
         buttons.append(Button(x, y, w, h, "Unmark Last (DEL)", self.unmark_word))
@@ -228,14 +369,14 @@ class LyricVideoCreator:
         y += h + gap + 14
 
         # PROJECT section
-        self.panel_labels.append(("PROJECT", y - 14))
+        self.panel_labels.append((self._render_text(self.label_font, "PROJECT", self.DIM_COLOR), y - 14))
         buttons.append(Button(x, y, w, h, "Save Project", self.save_project, color=(50, 70, 50)))
         y += h + gap
         buttons.append(Button(x, y, w, h, "Open Project", self.load_project, color=(50, 70, 50)))
         y += h + gap + 14
 
         # EXPORT section
-        self.panel_labels.append(("EXPORT", y - 14))
+        self.panel_labels.append((self._render_text(self.label_font, "EXPORT", self.DIM_COLOR), y - 14))
         buttons.append(Button(x, y, w, h, "Export Video (E)", self.export_video, color=(50, 50, 80)))
 
         return buttons
@@ -299,7 +440,39 @@ class LyricVideoCreator:
     def set_status(self, message: str, duration: float = 3.0):
         """Set a status message to display."""
         self.status_message = message
-        self.status_time = pygame.time.get_ticks() + duration * 1000
+        self._status_surface = self.small_font.render(message, True, self.CURRENT_COLOR)
+        # Re-arming replaces any pending expiry for an older message
+        pygame.time.set_timer(STATUS_EXPIRY_EVENT, max(1, int(duration * 1000)), loops=1)
+        self._dirty = True
+
+    def _render_text(self, font, text, color):
+        """Render a UI string once and reuse the surface on later frames.
+
+        Only for text that rarely changes (titles, labels, hints, the audio
+        file name); the cache is never pruned.
+        """
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = self._text_cache[key] = font.render(text, True, color).convert_alpha()
+        return surface
+
+    def _render_word(self, word, color):
+        """Render a lyric word (or an editor line) in self.font, reusing earlier renders."""
+        cache = self._word_surface_cache
+        key = (word, color)
+        surface = cache.get(key)
+        if surface is not None:
+            cache.move_to_end(key)
+            return surface
+
+        # Converted to the display's pixel format so blits don't convert per frame
+        surface = cache[key] = self.font.render(word, True, color).convert_alpha()
+        self._word_surface_bytes += surface.get_width() * surface.get_height() * 4
+        while self._word_surface_bytes > self.WORD_CACHE_BYTES and len(cache) > 1:
+            _, old = cache.popitem(last=False)
+            self._word_surface_bytes -= old.get_width() * old.get_height() * 4
+        return surface
 
     def load_audio(self):
         """Open file dialog to load audio."""
@@ -355,6 +528,8 @@ class LyricVideoCreator:
         self._edit_dragging = False
         self._edit_drag_origin = 0
         self.editing = True
+        self._blink_on = True
+        pygame.time.set_timer(CURSOR_BLINK_EVENT, CURSOR_BLINK_MS)
         self.edit_buttons = [
             Button(0, 0, 100, 32, "Save", self._confirm_edit, color=(50, 80, 50)),
             Button(0, 0, 100, 32, "Cancel", self._cancel_edit, color=(80, 50, 50)),
@@ -379,6 +554,7 @@ class LyricVideoCreator:
     def _exit_edit_mode(self):
         """Shared cleanup when leaving edit mode."""
         self.editing = False
+        pygame.time.set_timer(CURSOR_BLINK_EVENT, 0)
         self.edit_text = ""
         self.edit_cursor = 0
         self.edit_scroll_y = 0
@@ -416,70 +592,15 @@ class LyricVideoCreator:
                     self.edit_text = self.edit_text[:self.edit_cursor] + self.edit_text[self.edit_cursor + 1:]
             return
 
-        shift = mods & pygame.KMOD_SHIFT
-
-        if event.key == K_LEFT:
-            if shift:
-                if self.edit_sel_start is None:
-                    self.edit_sel_start = self.edit_cursor
-                if self.edit_cursor > 0:
-                    self.edit_cursor -= 1
-            else:
+        move = self._edit_moves.get(event.key)
+        if move:
+            # Shift extends the selection from where the caret was; any
+            # plain movement drops it
+            if not mods & pygame.KMOD_SHIFT:
                 self.edit_sel_start = None
-                if self.edit_cursor > 0:
-                    self.edit_cursor -= 1
-            return
-
-        if event.key == K_RIGHT:
-            if shift:
-                if self.edit_sel_start is None:
-                    self.edit_sel_start = self.edit_cursor
-                if self.edit_cursor < len(self.edit_text):
-                    self.edit_cursor += 1
-            else:
-                self.edit_sel_start = None
-                if self.edit_cursor < len(self.edit_text):
-                    self.edit_cursor += 1
-            return
-
-        if event.key == K_UP:
-            if shift:
-                if self.edit_sel_start is None:
-                    self.edit_sel_start = self.edit_cursor
-                self._editor_move_vertical(-1)
-            else:
-                self.edit_sel_start = None
-                self._editor_move_vertical(-1)
-            return
-
-        if event.key == K_DOWN:
-            if shift:
-                if self.edit_sel_start is None:
-                    self.edit_sel_start = self.edit_cursor
-                self._editor_move_vertical(1)
-            else:
-                self.edit_sel_start = None
-                self._editor_move_vertical(1)
-            return
-
-        if event.key == K_HOME:
-            if shift:
-                if self.edit_sel_start is None:
-                    self.edit_sel_start = self.edit_cursor
-            else:
-                self.edit_sel_start = None
-            line_start = self.edit_text.rfind('\n', 0, self.edit_cursor)
-            self.edit_cursor = line_start + 1 if line_start != -1 else 0
-            return
-
-        if event.key == K_END:
-            if shift:
-                if self.edit_sel_start is None:
-                    self.edit_sel_start = self.edit_cursor
-            else:
-                self.edit_sel_start = None
-            line_end = self.edit_text.find('\n', self.edit_cursor)
-            self.edit_cursor = line_end if line_end != -1 else len(self.edit_text)
+            elif self.edit_sel_start is None:
+                self.edit_sel_start = self.edit_cursor
+            move()
             return
 
         if ctrl and event.key == K_a:
@@ -493,6 +614,20 @@ class LyricVideoCreator:
                 self._editor_insert(clipboard)
             return
 
+    def _caret_left(self):
+        if self.edit_cursor > 0:
+            self.edit_cursor -= 1
+
+    def _caret_right(self):
+        if self.edit_cursor < len(self.edit_text):
+            self.edit_cursor += 1
+
+    def _caret_line_start(self):
+        self.edit_cursor = self._edit_line_span(self._edit_cursor_row())[0]
+
+    def _caret_line_end(self):
+        self.edit_cursor = self._edit_line_span(self._edit_cursor_row())[1]
+
     def _has_selection(self):
         """Return True if there is an active selection."""
         return self.edit_sel_start is not None and self.edit_sel_start != self.edit_cursor
@@ -521,28 +656,36 @@ class LyricVideoCreator:
 
     def _editor_move_vertical(self, direction):
         """Move cursor up (-1) or down (+1) by one logical line."""
+        row = self._edit_cursor_row()
+        target = row + direction
+        if target < 0 or target > len(self._edit_newlines()):
+            return  # Already on first/last line
+        col = self.edit_cursor - self._edit_line_span(row)[0]
+        start, end = self._edit_line_span(target)
+        self.edit_cursor = start + min(col, end - start)
+
+    def _edit_newlines(self):
+        """Sorted offsets of the '\n's in edit_text (recomputed when the text changes)."""
         text = self.edit_text
-        # Find current line start and column
-        line_start = text.rfind('\n', 0, self.edit_cursor)
-        col = self.edit_cursor - (line_start + 1) if line_start != -1 else self.edit_cursor
-
-        if direction == -1:
-            # Move up
-            if line_start == -1:
-                return  # Already on first line
-            prev_line_start = text.rfind('\n', 0, line_start)
-            prev_start = prev_line_start + 1 if prev_line_start != -1 else 0
-            prev_len = line_start - prev_start
-            self.edit_cursor = prev_start + min(col, prev_len)
-        else:
-            # Move down
-            line_end = text.find('\n', self.edit_cursor)
-            if line_end == -1:
-                return  # Already on last line
-            next_start = line_end + 1
-            next_line_end = text.find('\n', next_start)
-            next_len = (next_line_end if next_line_end != -1 else len(text)) - next_start
-            self.edit_cursor = next_start + min(col, next_len)
+        if self._newline_cache[0] is not text:
+            newlines = []
+            i = text.find('\n')
+            while i != -1:
+                newlines.append(i)
+                i = text.find('\n', i + 1)
+            self._newline_cache = (text, newlines)
+        return self._newline_cache[1]
+
+    def _edit_cursor_row(self):
+        """Logical (hard-newline) line the cursor is on."""
+        return bisect.bisect_left(self._edit_newlines(), self.edit_cursor)
+
+    def _edit_line_span(self, row):
+        """(start, end) source offsets of logical line row, excluding its '\n'."""
+        newlines = self._edit_newlines()
+        start = newlines[row - 1] + 1 if row > 0 else 0
+        end = newlines[row] if row < len(newlines) else len(self.edit_text)
+        return start, end
 
     def _hit_test_editor(self, x, y):
         """Given pixel coordinates, return the source-text cursor position."""
@@ -555,29 +698,19 @@ class LyricVideoCreator:
         row = int((y - top_y + self.edit_scroll_y) // line_h)
         row = max(0, min(row, len(lines) - 1))
 
-        # Walk characters in the row to find closest column
-        line = lines[row]
-        col = len(line)  # default to end of line
-        local_x = x - self.MARGIN
-        for i in range(len(line)):
-            char_x = self.font.size(line[:i + 1])[0]
-            prev_x = self.font.size(line[:i])[0] if i > 0 else 0
-            mid = (prev_x + char_x) / 2
-            if local_x < mid:
-                col = i
-                break
+        # The caret goes before the first character whose midpoint is right
+        # of the click (end of line if none)
+        col = bisect.bisect_right(_caret_midpoints(self.font, lines[row]), x - self.MARGIN)
 
         return line_starts[row] + col
 
     def _find_word_bounds(self, pos):
         """Return (start, end) of the word at source-text position pos."""
         text = self.edit_text
-        start = pos
-        end = pos
-        while start > 0 and text[start - 1] not in (' ', '\n'):
-            start -= 1
-        while end < len(text) and text[end] not in (' ', '\n'):
-            end += 1
+        # str.find/rfind scan in C and stop at the nearest break on each side
+        start = max(text.rfind(' ', 0, pos), text.rfind('\n', 0, pos)) + 1
+        breaks = [i for i in (text.find(' ', pos), text.find('\n', pos)) if i != -1]
+        end = min(breaks) if breaks else len(text)
         return start, end
 
     def toggle_play(self):
@@ -646,9 +779,7 @@ class LyricVideoCreator:
             f"Reset all {self.lyrics.get_timed_count()} word timings?"
         )
         if result:
-            for word in self.lyrics.words:
-                word.start_time = None
-            self.lyrics.current_index = 0
+            self.lyrics.reset_timings()
             self.set_status("All timings reset")
 
     def save_timing(self):
@@ -700,7 +831,6 @@ class LyricVideoCreator:
             initialfile=default_name
         )
         if file_path:
-            import json
             project_data = {
                 "version": 1,
                 "audio_file": self.audio_file,
@@ -710,8 +840,7 @@ class LyricVideoCreator:
                 ]
             }
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(project_data, f, indent=2, ensure_ascii=False)
+                write_json(file_path, project_data)
                 self.set_status(f"Project saved: {os.path.basename(file_path)}")
             except Exception as e:
                 self.set_status(f"Save failed: {e}")
@@ -727,10 +856,8 @@ class LyricVideoCreator:
 
     def _open_project(self, file_path):
         """Internal method to open a project file."""
-        import json
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                project_data = json.load(f)
+            project_data = read_json(file_path)
 
             # Load audio if specified and exists
             audio_path = project_data.get("audio_file")
@@ -746,12 +873,7 @@ class LyricVideoCreator:
                     self.set_status(f"Audio file not found: {os.path.basename(audio_path)}")
 
             # Load words/timing
-            from lyrics_timer import TimedWord
-            self.lyrics.words = [
-                TimedWord(word=w["word"], start_time=w["start_time"], index=w["index"])
-                for w in project_data.get("words", [])
-            ]
-            self.lyrics.current_index = self.lyrics.get_next_untimed_index()
+            self.lyrics.set_word_dicts(project_data.get("words", []))
 
             self.set_status(f"Project loaded: {os.path.basename(file_path)}")
         except Exception as e:
@@ -768,20 +890,20 @@ class LyricVideoCreator:
             return
 
         if not self.lyrics.is_complete():
-            result = dialogs.askyesno(
+            result = self._wait_for_dialog(dialogs.askyesno_async(
                 "Incomplete Timing",
                 f"Only {self.lyrics.get_timed_count()}/{self.lyrics.get_total_words()} words are timed. Export anyway?"
-            )
-            if not result:
+            ))
+            if not result or not self.running:
                 return
 
         # Ask for resolution
-        resolution = dialogs.askchoice(
+        resolution = self._wait_for_dialog(dialogs.askchoice_async(
             "Video Resolution",
             "Select video resolution:",
-            ["1080p (1920x1080)", "720p (1280x720)", "480p (854x480)"]
-        )
-        if not resolution:
+            list(self.EXPORT_RESOLUTION_CHOICES)
+        ))
+        if not resolution or not self.running:
             return
 
         # Extract resolution key (e.g., "1080p" from "1080p (1920x1080)")
@@ -790,16 +912,23 @@ class LyricVideoCreator:
         # Default to same name as audio file
         default_name = os.path.splitext(os.path.basename(self.audio_file))[0] + ".mp4"
 
-        file_path = dialogs.asksaveasfilename(
+        file_path = self._wait_for_dialog(dialogs.asksaveasfilename_async(
             title="Export Video",
             defaultextension=".mp4",
             initialfile=default_name
-        )
-        if file_path:
+        ))
+        if file_path and self.running:
             self.set_status(f"Rendering video ({resolution_key})...")
             pygame.display.flip()
 
+            exported = False
             render_cancelled = [False]
+            # Future of the open "Cancel Export" box; the render waits at its
+            # next frame while render_resume is clear. render_cancelled is
+            # always settled before the worker is woken
+            cancel_confirm = [None]
+            render_resume = threading.Event()
+            render_resume.set()
             render_start = [0.0]
             eta_display = [""]
             eta_last_update = [0.0]
@@ -809,36 +938,118 @@ class LyricVideoCreator:
                 vid_w, vid_h = RESOLUTIONS.get(resolution_key, RESOLUTIONS["1080p"])
                 output_filename = os.path.basename(file_path)
 
-                # Cancel text-link rect (updated each frame in progress())
+                # Cancel text-link rect (updated each frame in draw_progress())
                 cancel_rect = [pygame.Rect(0, 0, 0, 0)]
                 cancel_hovered = [False]
 
+                # Thumbnail preview surface, allocated on the first frame
+                thumb_surface = [None]
+                # Window size + hover states last pushed with a full flip
+                shown_view = [None]
+                # Window size and (surface, rect) pairs of the static labels
+                static_blits = [None, []]
+                # Latest (p, frame, frame_num, total_frames) from the render thread
+                latest_progress = [None]
+                render_error = [None]
+
                 # Social link rects/urls for hover + click (populated each frame)
                 social_rects = []  # list of (pygame.Rect, url)
+                social_icon_pos = []  # top-left of each icon, parallel to social_rects
+                social_rects_size = [None]  # window size the rects were laid out for
 
-                # Pre-load social icon images
+                socials = [
+                    ("instagram", "https://www.instagram.com/raiden.uruguay/"),
+                    ("youtube", "https://www.youtube.com/channel/UCMXZ_2MJMHX00-RPPgcwSSg"),
+                    ("spotify", "https://open.spotify.com/artist/7aeHdbSpQpe0pBxxFYwBrb"),
+                ]
+
+                # Pre-load social icon images, scaled once to their display
+                # size as (dimmed, hover-brightened) pairs
+                icon_display_size = 28
                 _social_icons = {}
-                for _name in ("instagram", "youtube", "spotify"):
+                for _name, _ in socials:
                     _path = resource_path(f"icon_{_name}.png")
                     if os.path.exists(_path):
-                        _social_icons[_name] = pygame.image.load(_path).convert_alpha()
+                        _icon = pygame.transform.smoothscale(
+                            pygame.image.load(_path).convert_alpha(),
+                            (icon_display_size, icon_display_size))
+                        # Brighten on hover
+                        _bright = pygame.Surface(_icon.get_size(), pygame.SRCALPHA)
+                        _bright.fill((60, 60, 60, 0))
+                        _hover = _icon.copy()
+                        _hover.blit(_bright, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
+                        # Dim slightly when not hovered
+                        _icon.set_alpha(180)
+                        _social_icons[_name] = (_icon, _hover)
+
+                def ask_cancel():
+                    if cancel_confirm[0] is None:
+                        render_resume.clear()
+                        cancel_confirm[0] = dialogs.askyesno_async("Cancel Export", "Cancel the video export?")
+
+                def pump_events():
+                    events = pygame.event.get((KEYDOWN, MOUSEBUTTONDOWN, MOUSEMOTION))
+                    # Everything else is dropped (don't quit during render)
+                    pygame.event.clear(pump=False)
+                    for event in events:
+                        if event.type == KEYDOWN and event.key == K_ESCAPE:
+                            ask_cancel()
+                        elif event.type == MOUSEBUTTONDOWN and event.button == 1:
+                            if cancel_rect[0].collidepoint(event.pos):
+                                ask_cancel()
+                            else:
+                                for rect, url in social_rects:
+                                    if rect.collidepoint(event.pos):
+                                        webbrowser.open(url)
+                                        break
+                        elif event.type == MOUSEMOTION:
+                            cancel_hovered[0] = cancel_rect[0].collidepoint(event.pos)
+                            any_hovered = cancel_hovered[0] or any(
+                                r.collidepoint(event.pos) for r, _ in social_rects)
+                            pygame.mouse.set_cursor(
+                                pygame.SYSTEM_CURSOR_HAND if any_hovered else pygame.SYSTEM_CURSOR_ARROW)
 
                 def progress(p, frame=None, frame_num=0, total_frames=0):
+                    # Called on the render thread for every encoded frame;
+                    # only hand the numbers over, the main thread draws
+                    latest_progress[0] = (p, frame, frame_num, total_frames)
+
+                def draw_progress(p, frame=None, frame_num=0, total_frames=0):
+                    draw_now = _time.monotonic()
                     self.screen.fill(self.BG_COLOR)
                     cx, cy = self.WIDTH // 2, self.HEIGHT // 2
+                    promo_top = int(self.HEIGHT * 0.78)
 
-                    # --- Title + info ---
-                    title_surf = self.title_font.render("Exporting Video", True, self.TEXT_COLOR)
-                    self.screen.blit(title_surf, title_surf.get_rect(center=(cx, int(self.HEIGHT * 0.10))))
-
-                    info_text = f"{vid_w} \u00d7 {vid_h}  \u00b7  {output_filename}"
-                    info_surf = self.small_font.render(info_text, True, self.DIM_COLOR)
-                    self.screen.blit(info_surf, info_surf.get_rect(center=(cx, int(self.HEIGHT * 0.15))))
+                    # Static labels (title, info, promo message) are placed
+                    # once per window size
+                    if static_blits[0] != (self.WIDTH, self.HEIGHT):
+                        # --- Title + info ---
+                        title_surf = self._render_text(self.title_font, "Exporting Video", self.TEXT_COLOR)
+                        info_text = f"{vid_w} \u00d7 {vid_h}  \u00b7  {output_filename}"
+                        info_surf = self._render_text(self.small_font, info_text, self.DIM_COLOR)
+
+                        # Promo message (two lines for readability)
+                        line1 = "Hope you're enjoying this free app! I built it to share songs"
+                        line2 = "and lyrics with my band RAIDEN \u2014 check us out!"
+                        line1_surf = self._render_text(self.small_font, line1, self.DIM_COLOR)
+                        line2_surf = self._render_text(self.small_font, line2, self.DIM_COLOR)
+
+                        static_blits[1] = [
+                            (title_surf, title_surf.get_rect(center=(cx, int(self.HEIGHT * 0.10)))),
+                            (info_surf, info_surf.get_rect(center=(cx, int(self.HEIGHT * 0.15)))),
+                            (line1_surf, line1_surf.get_rect(center=(cx, promo_top + 18))),
+                            (line2_surf, line2_surf.get_rect(center=(cx, promo_top + 36))),
+                        ]
+                        static_blits[0] = (self.WIDTH, self.HEIGHT)
+
+                    # Text and images are collected here and blitted in one
+                    # call once the shapes are drawn (none of them overlap)
+                    blit_batch = list(static_blits[1])
 
                     # --- Circular progress ring ---
                     ring_radius = 60
                     ring_width = 5
-                    pulse = math.sin(pygame.time.get_ticks() / 400.0) * 2
+                    pulse = math.sin(draw_now * 1000 / 400.0) * 2
                     r = int(ring_radius + pulse)
                     ring_cy = int(self.HEIGHT * 0.30)
                     ring_rect = pygame.Rect(cx - r, ring_cy - r, r * 2, r * 2)
@@ -855,11 +1066,11 @@ class LyricVideoCreator:
 
                     # Percentage inside ring
                     pct_text = f"{int(p * 100)}%"
-                    pct_surf = self.title_font.render(pct_text, True, self.TEXT_COLOR)
-                    self.screen.blit(pct_surf, pct_surf.get_rect(center=(cx, ring_cy)))
+                    pct_surf = self._render_text(self.title_font, pct_text, self.TEXT_COLOR)  # 0-100%, bounded
+                    blit_batch.append((pct_surf, pct_surf.get_rect(center=(cx, ring_cy))))
 
                     # --- Frame count + ETA ---
-                    now = _time.monotonic()
+                    now = draw_now
                     if render_start[0] == 0.0:
                         render_start[0] = now
 
@@ -877,32 +1088,39 @@ class LyricVideoCreator:
 
                     frame_text = f"Frame {frame_num:,} / {total_frames:,}{eta_part}"
                     frame_surf = self.small_font.render(frame_text, True, self.DIM_COLOR)
-                    self.screen.blit(frame_surf, frame_surf.get_rect(center=(cx, int(self.HEIGHT * 0.44))))
+                    frame_rect = frame_surf.get_rect(center=(cx, int(self.HEIGHT * 0.44)))
+                    blit_batch.append((frame_surf, frame_rect))
 
                     # --- Thumbnail preview ---
                     thumb_y = int(self.HEIGHT * 0.48)
+                    thumb_h = int(self.HEIGHT * 0.22)
                     if frame is not None:
-                        thumb_h = int(self.HEIGHT * 0.22)
                         thumb_w = int(thumb_h * vid_w / vid_h)
-                        thumb_surf = pygame.image.frombuffer(
-                            frame.tobytes(), (frame.shape[1], frame.shape[0]), 'RGB'
+                        # Wrap the frame array directly (no tobytes() copy) and
+                        # scale into a surface reused across callbacks;
+                        # ascontiguousarray is a no-op for the renderer's frames
+                        frame = np.ascontiguousarray(frame, dtype=np.uint8)
+                        frame_view = pygame.image.frombuffer(
+                            frame, (frame.shape[1], frame.shape[0]), 'RGB'
                         )
-                        thumb_surf = pygame.transform.smoothscale(thumb_surf, (thumb_w, thumb_h))
+                        if thumb_surface[0] is None or thumb_surface[0].get_size() != (thumb_w, thumb_h):
+                            thumb_surface[0] = pygame.Surface((thumb_w, thumb_h), 0, frame_view)
+                        thumb_surf = pygame.transform.smoothscale(frame_view, (thumb_w, thumb_h), thumb_surface[0])
                         thumb_x = cx - thumb_w // 2
                         border = 2
                         pygame.draw.rect(self.screen, self.DIM_COLOR,
                                          (thumb_x - border, thumb_y - border,
                                           thumb_w + border * 2, thumb_h + border * 2),
                                          border_radius=4)
-                        self.screen.blit(thumb_surf, (thumb_x, thumb_y))
+                        blit_batch.append((thumb_surf, (thumb_x, thumb_y)))
 
                     # --- Cancel text link ---
                     cancel_label = "Cancel (Esc)"
                     cancel_color = self.TEXT_COLOR if cancel_hovered[0] else self.DIM_COLOR
-                    cancel_surf = self.small_font.render(cancel_label, True, cancel_color)
+                    cancel_surf = self._render_text(self.small_font, cancel_label, cancel_color)
                     cancel_x = cx - cancel_surf.get_width() // 2
                     cancel_y = int(self.HEIGHT * 0.73)
-                    self.screen.blit(cancel_surf, (cancel_x, cancel_y))
+                    blit_batch.append((cancel_surf, (cancel_x, cancel_y)))
                     ul_y = cancel_y + cancel_surf.get_height() + 1
                     pygame.draw.line(self.screen, cancel_color,
                                      (cancel_x, ul_y),
@@ -912,96 +1130,129 @@ class LyricVideoCreator:
                                                   cancel_surf.get_height() + 4)
 
                     # --- RAIDEN promo section ---
-                    promo_top = int(self.HEIGHT * 0.78)
-
                     # Divider line
                     div_w = min(400, self.WIDTH - 80)
                     pygame.draw.line(self.screen, (50, 50, 50),
                                      (cx - div_w // 2, promo_top),
                                      (cx + div_w // 2, promo_top), 1)
 
-                    # Promo message (two lines for readability)
-                    line1 = "Hope you're enjoying this free app! I built it to share songs"
-                    line2 = "and lyrics with my band RAIDEN \u2014 check us out!"
-                    line1_surf = self.small_font.render(line1, True, self.DIM_COLOR)
-                    line2_surf = self.small_font.render(line2, True, self.DIM_COLOR)
-                    self.screen.blit(line1_surf, line1_surf.get_rect(center=(cx, promo_top + 18)))
-                    self.screen.blit(line2_surf, line2_surf.get_rect(center=(cx, promo_top + 36)))
-
-                    # Social icons row (icon images only, no text labels)
-                    icon_display_size = 28
-                    icon_gap = 52
-                    icon_y = promo_top + 66
-                    mouse_pos = pygame.mouse.get_pos()
+                    # Social icons row (icon images only, no text labels);
+                    # positions only depend on the window size
+                    if social_rects_size[0] != (self.WIDTH, self.HEIGHT):
+                        icon_gap = 52
+                        icon_y = promo_top + 66
+                        total_w = (len(socials) - 1) * icon_gap
+                        start_x = cx - total_w // 2
+                        social_rects.clear()
+                        social_icon_pos.clear()
+                        for i, (kind, url) in enumerate(socials):
+                            ix = start_x + i * icon_gap
+                            hit_rect = pygame.Rect(ix - icon_display_size // 2 - 4,
+                                                   icon_y - icon_display_size // 2 - 4,
+                                                   icon_display_size + 8, icon_display_size + 8)
+                            social_rects.append((hit_rect, url))
+                            social_icon_pos.append((ix - icon_display_size // 2,
+                                                    icon_y - icon_display_size // 2))
+                        social_rects_size[0] = (self.WIDTH, self.HEIGHT)
 
-                    socials = [
-                        ("instagram", "https://www.instagram.com/raiden.uruguay/"),
-                        ("youtube", "https://www.youtube.com/channel/UCMXZ_2MJMHX00-RPPgcwSSg"),
-                        ("spotify", "https://open.spotify.com/artist/7aeHdbSpQpe0pBxxFYwBrb"),
-                    ]
-                    social_rects.clear()
-                    total_w = (len(socials) - 1) * icon_gap
-                    start_x = cx - total_w // 2
-
-                    for i, (kind, url) in enumerate(socials):
-                        ix = start_x + i * icon_gap
-                        hit_rect = pygame.Rect(ix - icon_display_size // 2 - 4,
-                                               icon_y - icon_display_size // 2 - 4,
-                                               icon_display_size + 8, icon_display_size + 8)
+                    mouse_pos = pygame.mouse.get_pos()
+                    icons_hovered = []
+                    for (kind, _), (hit_rect, _), icon_pos in zip(socials, social_rects, social_icon_pos):
                         is_hovered = hit_rect.collidepoint(mouse_pos)
-                        social_rects.append((hit_rect, url))
-
+                        icons_hovered.append(is_hovered)
                         if kind in _social_icons:
-                            icon_surf = pygame.transform.smoothscale(
-                                _social_icons[kind],
-                                (icon_display_size, icon_display_size))
-                            if is_hovered:
-                                # Brighten on hover
-                                bright = pygame.Surface(icon_surf.get_size(), pygame.SRCALPHA)
-                                bright.fill((60, 60, 60, 0))
-                                icon_surf = icon_surf.copy()
-                                icon_surf.blit(bright, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
-                            else:
-                                # Dim slightly when not hovered
-                                icon_surf.set_alpha(180)
-                            self.screen.blit(icon_surf,
-                                             (ix - icon_display_size // 2,
-                                              icon_y - icon_display_size // 2))
-
-                    pygame.display.flip()
-
-                    # Process events to prevent "not responding"
-                    for event in pygame.event.get():
-                        if event.type == QUIT:
-                            pass  # Don't quit during render
-                        elif event.type == KEYDOWN and event.key == K_ESCAPE:
-                            if dialogs.askyesno("Cancel Export", "Cancel the video export?"):
+                            icon_surf = _social_icons[kind][1 if is_hovered else 0]
+                            blit_batch.append((icon_surf, icon_pos))
+
+                    self.screen.blits(blit_batch, doreturn=False)
+
+                    # Between callbacks only the ring, the frame/ETA line and
+                    # the thumbnail change; push just those rows unless the
+                    # size or a hover highlight changed too
+                    view = (self.WIDTH, self.HEIGHT, cancel_hovered[0], tuple(icons_hovered), frame is None)
+                    if view != shown_view[0]:
+                        pygame.display.flip()
+                        shown_view[0] = view
+                    else:
+                        ring_extent = ring_radius + 3  # covers the pulse
+                        pygame.display.update([
+                            pygame.Rect(cx - ring_extent, ring_cy - ring_extent, ring_extent * 2, ring_extent * 2),
+                            pygame.Rect(0, frame_rect.top, self.WIDTH, frame_rect.height),
+                            pygame.Rect(0, thumb_y - 2, self.WIDTH, thumb_h + 4),
+                        ])
+
+                def check_cancelled():
+                    render_resume.wait()
+                    return render_cancelled[0]
+
+                def render_worker():
+                    try:
+                        renderer.render(file_path, progress_callback=progress,
+                                        check_cancelled=check_cancelled)
+                    except BaseException as e:  # re-raised on the main thread
+                        render_error[0] = e
+
+                # Encode on a worker thread so the window keeps responding;
+                # the progress screen is repainted at most 30 times a second
+                # however fast frames come in. A cancel box that is still open
+                # when the render ends is waited for, so a late "yes" counts
+                worker = threading.Thread(target=render_worker, name="video-export", daemon=True)
+                worker.start()
+                while worker.is_alive() or cancel_confirm[0] is not None:
+                    if cancel_confirm[0] is not None and cancel_confirm[0].done():
+                        confirmed = cancel_confirm[0]
+                        cancel_confirm[0] = None
+                        try:
+                            if confirmed.result():
                                 render_cancelled[0] = True
-                        elif event.type == MOUSEBUTTONDOWN and event.button == 1:
-                            if cancel_rect[0].collidepoint(event.pos):
-                                if dialogs.askyesno("Cancel Export", "Cancel the video export?"):
-                                    render_cancelled[0] = True
-                            else:
-                                for rect, url in social_rects:
-                                    if rect.collidepoint(event.pos):
-                                        webbrowser.open(url)
-                                        break
-                        elif event.type == MOUSEMOTION:
-                            cancel_hovered[0] = cancel_rect[0].collidepoint(event.pos)
-                            any_hovered = cancel_hovered[0] or any(
-                                r.collidepoint(event.pos) for r, _ in social_rects)
-                            pygame.mouse.set_cursor(
-                                pygame.SYSTEM_CURSOR_HAND if any_hovered else pygame.SYSTEM_CURSOR_ARROW)
-
-                renderer.render(file_path, progress_callback=progress,
-                                check_cancelled=lambda: render_cancelled[0])
+                        finally:
+                            render_resume.set()
+                    if latest_progress[0] is not None:
+                        draw_progress(*latest_progress[0])
+                    # Process events to prevent "not responding"
+                    pump_events()
+                    self.clock.tick(30)
+                worker.join()
+                if render_error[0] is not None:
+                    raise render_error[0]
+                if render_cancelled[0]:
+                    # Confirmed after the last frame had been rendered
+                    if os.path.exists(file_path):
+                        os.remove(file_path)
+                    raise RenderCancelled()
                 self.set_status(f"Exported: {os.path.basename(file_path)}")
-                dialogs.showinfo("Export Complete", f"Video saved to: {file_path}")
+                exported = True
             except RenderCancelled:
                 self.set_status("Export cancelled")
             except Exception as e:
                 self.set_status(f"Export failed: {e}")
                 dialogs.showerror("Export Error", str(e))
+            finally:
+                self._cursor_kind = None  # the progress screen sets its own cursor
+                self._presented_panel = None  # and covers the panel
+
+            if exported:
+                # Modal like the dialogs before the export (a box left open
+                # would hold up every later dialog, clipboard and file
+                # pickers included, on the one dialog thread), but the
+                # window keeps painting while it is up
+                self._wait_for_dialog(dialogs.showinfo_async(
+                    "Export Complete", f"Video saved to: {file_path}"))
+
+    def _wait_for_dialog(self, future):
+        """Keep the window painted while a dialog runs on the dialog thread.
+
+        Input is dropped (the dialog is modal); quit, timer, music and
+        window events are still handled, so callers should check
+        self.running afterwards. Returns the dialog's result.
+        """
+        while not future.done():
+            for event in pygame.event.get():
+                if event.type in DIALOG_PASSTHROUGH_EVENTS:
+                    self.handle_event(event)
+            self.draw()
+            self.clock.tick(30)
+        return future.result()
 
     def handle_event(self, event):
         """Handle pygame events."""
@@ -1009,6 +1260,22 @@ class LyricVideoCreator:
             self.running = False
             return
 
+        if event.type == MUSIC_END_EVENT:
+            self.audio.handle_event(event)
+            return
+
+        if event.type == STATUS_EXPIRY_EVENT:
+            self._status_surface = None
+            return
+
+        if event.type == CURSOR_BLINK_EVENT:
+            self._blink_on = not self._blink_on
+            return
+
+        if event.type == pygame.WINDOWEXPOSED:
+            self._presented_panel = None  # the window contents need a full present
+            return
+
         if event.type == VIDEORESIZE:
             self.WIDTH, self.HEIGHT = event.w, event.h
             self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT), pygame.RESIZABLE)
@@ -1055,10 +1322,16 @@ class LyricVideoCreator:
                 return
             return
 
-        # Handle button events
-        for button in self.buttons:
-            if button.handle_event(event):
-                return
+        # Handle button events (buttons only react to pointer events, and
+        # none can be under a pointer outside their bounding box)
+        if event.type == MOUSEMOTION or event.type == MOUSEBUTTONDOWN:
+            if self._panel_buttons_bbox().collidepoint(event.pos):
+                for button in self.buttons:
+                    if button.handle_event(event):
+                        return
+            elif event.type == MOUSEMOTION:
+                for button in self.buttons:
+                    button.is_hovered = False
 
         if event.type == KEYDOWN:
             if event.key == K_ESCAPE:
@@ -1107,21 +1380,21 @@ class LyricVideoCreator:
         """Draw the UI."""
         self.screen.fill(self.BG_COLOR)
 
-        # Button panel background
+        # Sample playback once so every element of this frame agrees
+        current_time = self.audio.get_position()
+        is_playing = self.audio.is_playing()
+
+        # Button panel (cached; repainted only when a hover state or the size changes)
         panel_x = self.WIDTH - self.BUTTON_PANEL_WIDTH
-        pygame.draw.rect(self.screen, self.PANEL_COLOR, (panel_x, 0, self.BUTTON_PANEL_WIDTH, self.HEIGHT))
+        panel = self._get_button_panel()
+        self.screen.blit(panel, (panel_x, 0))
 
-        # Panel divider — 4px gradient shadow for depth
-        for i in range(4):
-            alpha = 40 - i * 10
-            shadow_color = (0, 0, 0)
-            shadow_surf = pygame.Surface((1, self.HEIGHT), pygame.SRCALPHA)
-            shadow_surf.fill((*shadow_color, alpha))
-            self.screen.blit(shadow_surf, (panel_x + i, 0))
+        # Header text is collected and blitted in one call below
+        header_blits = []
 
         # Title
-        title = self.title_font.render("FREE Lyric Video Creator", True, self.TEXT_COLOR)
-        self.screen.blit(title, (self.MARGIN, self.MARGIN))
+        title = self._render_text(self.title_font, "FREE Lyric Video Creator", self.TEXT_COLOR)
+        header_blits.append((title, (self.MARGIN, self.MARGIN)))
 
         # Title accent underline
         title_underline_y = self.MARGIN + title.get_height() + 4
@@ -1129,50 +1402,30 @@ class LyricVideoCreator:
                          (self.MARGIN, title_underline_y),
                          (self.MARGIN + title.get_width(), title_underline_y), 2)
 
-        # Panel header — uppercase "CONTROLS" with thin underline
-        header_text = self.label_font.render("CONTROLS", True, self.DIM_COLOR)
-        header_x = panel_x + 10
-        header_y = 16
-        self.screen.blit(header_text, (header_x, header_y))
-        underline_y = header_y + header_text.get_height() + 3
-        pygame.draw.line(self.screen, self.ACCENT_COLOR,
-                         (header_x, underline_y),
-                         (panel_x + self.BUTTON_PANEL_WIDTH - 10, underline_y), 1)
-
-        # Panel section labels
-        for label_text, label_y in self.panel_labels:
-            label_surf = self.label_font.render(label_text, True, self.DIM_COLOR)
-            self.screen.blit(label_surf, (panel_x + 10, label_y))
-            line_y = label_y + label_surf.get_height() + 1
-            pygame.draw.line(self.screen, self.ACCENT_COLOR,
-                             (panel_x + 10 + label_surf.get_width() + 6, line_y),
-                             (panel_x + self.BUTTON_PANEL_WIDTH - 10, line_y), 1)
-
-        # Draw buttons
-        for button in self.buttons:
-            button.draw(self.screen, self.button_font)
-
         # Audio info
         content_width = panel_x - self.MARGIN * 2
         y = self.MARGIN + 45
 
         if self.audio_file:
             audio_text = f"Audio: {os.path.basename(self.audio_file)}"
-            audio_surface = self.small_font.render(audio_text, True, self.TEXT_COLOR)
+            audio_surface = self._render_text(self.small_font, audio_text, self.TEXT_COLOR)
         else:
-            audio_surface = self.small_font.render("No audio loaded", True, self.DIM_COLOR)
-        self.screen.blit(audio_surface, (self.MARGIN, y))
+            audio_surface = self._render_text(self.small_font, "No audio loaded", self.DIM_COLOR)
+        header_blits.append((audio_surface, (self.MARGIN, y)))
 
         # Time display
         y += 22
         if self.audio_file:
-            pos = self.audio.get_position()
             dur = self.audio.duration
-            state = "PLAYING" if self.audio.is_playing() else "PAUSED" if self.audio.is_paused() else "STOPPED"
-            time_text = f"{self._format_time(pos)} / {self._format_time(dur)}  [{state}]"
-            time_color = self.TIMED_COLOR if self.audio.is_playing() else self.TEXT_COLOR
-            time_surface = self.small_font.render(time_text, True, time_color)
-            self.screen.blit(time_surface, (self.MARGIN, y))
+            state = "PLAYING" if is_playing else "PAUSED" if self.audio.is_paused() else "STOPPED"
+            time_text = f"{self._format_time(current_time)} / {self._format_time(dur)}  [{state}]"
+            time_color = self.TIMED_COLOR if is_playing else self.TEXT_COLOR
+            # The clock text changes once a second; re-render only then
+            if self._time_cache[:2] != (time_text, time_color):
+                self._time_cache = (time_text, time_color,
+                                    self.small_font.render(time_text, True, time_color))
+            header_blits.append((self._time_cache[2], (self.MARGIN, y)))
+        self.screen.blits(header_blits, doreturn=False)
 
         # Progress bar — thin pill with glow dot
         y += 25
@@ -1182,7 +1435,7 @@ class LyricVideoCreator:
         # Dark inset track
         pygame.draw.rect(self.screen, (30, 30, 30), (self.MARGIN, bar_y, bar_width, bar_height), border_radius=3)
         if self.audio.duration > 0:
-            progress = self.audio.get_position() / self.audio.duration
+            progress = current_time / self.audio.duration
             fill_width = int(bar_width * progress)
             if fill_width > 0:
                 pygame.draw.rect(self.screen, self.TIMED_COLOR, (self.MARGIN, bar_y, fill_width, bar_height), border_radius=3)
@@ -1201,54 +1454,38 @@ class LyricVideoCreator:
         if self.editing:
             self._draw_editor(y, content_width, lyrics_area_height)
         elif not self.lyrics.words:
-            no_lyrics = self.font.render("No lyrics loaded", True, self.DIM_COLOR)
+            no_lyrics = self._render_text(self.font, "No lyrics loaded", self.DIM_COLOR)
             self.screen.blit(no_lyrics, (self.MARGIN, y + 50))
         else:
             # Get the next word index to time
             next_untimed = self.lyrics.get_next_untimed_index()
-            current_time = self.audio.get_position()
-            is_playing = self.audio.is_playing()
-            current_word, _ = self.lyrics.get_word_at_time(current_time) if is_playing else (None, 0)
-
-            # Lookahead word for scroll target (500ms ahead)
-            lookahead_word, _ = self.lyrics.get_word_at_time(current_time + 0.5) if is_playing else (None, 0)
+            # Current word, plus a lookahead word (500ms ahead) for the scroll target
+            if is_playing:
+                (current_word, _), (lookahead_word, _) = self.lyrics.get_words_at_times(
+                    [current_time, current_time + 0.5])
+            else:
+                current_word = lookahead_word = None
 
             lyrics_top = y
             lyrics_area_center = lyrics_top + lyrics_area_height // 2
 
-            # --- Layout pass: compute (x, y) for every word ---
-            layout = []  # list of (word, lx, ly)
-            lx = self.MARGIN
-            ly = 0  # relative y (before scroll offset)
-            target_y = 0
-
-            for word in self.lyrics.words:
-                if word.word == '\n':
-                    lx = self.MARGIN
-                    ly += self.LINE_HEIGHT
-                    continue
-
-                word_surface = self.font.render(word.word, True, self.TEXT_COLOR)
-                word_width = word_surface.get_width()
-
-                # Wrap to next line if needed
-                if lx + word_width > content_width:
-                    lx = self.MARGIN
-                    ly += self.LINE_HEIGHT
-
-                layout.append((word, lx, ly))
-
-                # Scroll target uses lookahead word (500ms ahead) so the
-                # view pre-scrolls before the highlight reaches a new line
-                if lookahead_word and word.index == lookahead_word.index:
-                    target_y = ly
-                elif lookahead_word is None:
-                    if current_word and word.index == current_word.index:
-                        target_y = ly
-                    elif current_word is None and word.index == next_untimed:
-                        target_y = ly
-
-                lx += word_width + 10
+            # Start a fresh word cache when different lyrics are loaded
+            if self._word_surface_words is not self.lyrics.words:
+                self._word_surface_cache.clear()
+                self._word_surface_bytes = 0
+                self._word_surface_words = self.lyrics.words
+
+            # --- Layout: (x, y) for every word, reused until the lyrics or width change ---
+            layout, row_y, layout_ys = self._layout_lyrics(content_width)
+
+            # Scroll target uses lookahead word (500ms ahead) so the
+            # view pre-scrolls before the highlight reaches a new line
+            if lookahead_word:
+                target_y = row_y.get(lookahead_word.index, 0)
+            elif current_word:
+                target_y = row_y.get(current_word.index, 0)
+            else:
+                target_y = row_y.get(next_untimed, 0)
 
             # --- Snap scroll to target line ---
             scroll_target = target_y - (lyrics_area_center - lyrics_top)
@@ -1259,36 +1496,42 @@ class LyricVideoCreator:
             clip_rect = pygame.Rect(0, lyrics_top, panel_x, lyrics_area_height)
             self.screen.set_clip(clip_rect)
 
-            for word, lx, ly in layout:
-                draw_y = lyrics_top + ly - self.lyrics_scroll_y
+            # Rows are in order, so the words in view are one contiguous slice
+            first = int(np.searchsorted(layout_ys, self.lyrics_scroll_y - self.LINE_HEIGHT, side='left'))
+            last = int(np.searchsorted(layout_ys, self.lyrics_scroll_y + lyrics_area_height, side='right'))
+
+            blit_list = []
+            append, render_word = blit_list.append, self._render_word
+            current_index = current_word.index if current_word else -1
+            timed_color, text_color, dim_color = self.TIMED_COLOR, self.TEXT_COLOR, self.DIM_COLOR
+            first_y = lyrics_top - self.lyrics_scroll_y
+            line_h = self.LINE_HEIGHT
+            bottom_y = lyrics_top + lyrics_area_height
+            for word, lx, ly in layout[first:last]:
+                draw_y = first_y + ly
 
                 # Skip words fully outside clip area
-                if draw_y + self.LINE_HEIGHT < lyrics_top or draw_y > lyrics_top + lyrics_area_height:
+                if draw_y + line_h < lyrics_top or draw_y > bottom_y:
                     continue
 
-                # Determine color
-                is_current = current_word and word.index == current_word.index
-                if is_current:
-                    color = self.CURRENT_COLOR
+                if word.index == current_index:
+                    # Semi-transparent gold pill behind the current word
+                    word_surface = render_word(word.word, self.CURRENT_COLOR)
+                    pill_pad_x, pill_pad_y = 4, 2
+                    pill = _highlight_pill(word_surface.get_width() + pill_pad_x * 2,
+                                           word_surface.get_height() + pill_pad_y * 2)
+                    append((pill, (lx - pill_pad_x, draw_y - pill_pad_y)))
                 elif word.start_time is not None:
-                    color = self.TIMED_COLOR
+                    word_surface = render_word(word.word, timed_color)
                 elif word.index == next_untimed:
-                    color = self.TEXT_COLOR
+                    word_surface = render_word(word.word, text_color)
                 else:
-                    color = self.DIM_COLOR
-
-                word_surface = self.font.render(word.word, True, color)
+                    word_surface = render_word(word.word, dim_color)
 
-                # Semi-transparent gold pill behind the current word
-                if is_current:
-                    pill_pad_x, pill_pad_y = 4, 2
-                    pill_w = word_surface.get_width() + pill_pad_x * 2
-                    pill_h = word_surface.get_height() + pill_pad_y * 2
-                    pill_surf = pygame.Surface((pill_w, pill_h), pygame.SRCALPHA)
-                    pygame.draw.rect(pill_surf, (255, 215, 0, 35), (0, 0, pill_w, pill_h), border_radius=6)
-                    self.screen.blit(pill_surf, (lx - pill_pad_x, draw_y - pill_pad_y))
+                append((word_surface, (lx, draw_y)))
 
-                self.screen.blit(word_surface, (lx, draw_y))
+            # One batched call instead of a blit per visible word
+            self.screen.blits(blit_list, doreturn=False)
 
             self.screen.set_clip(None)
 
@@ -1302,27 +1545,150 @@ class LyricVideoCreator:
         # Top row: stats (white, left-aligned)
         row1_y = y + 10
         stats = f"Words timed: {self.lyrics.get_timed_count()} / {self.lyrics.get_total_words()}"
-        stats_surface = self.small_font.render(stats, True, self.TEXT_COLOR)
-        self.screen.blit(stats_surface, (self.MARGIN, row1_y))
+        if self._stats_cache[0] != stats:
+            self._stats_cache = (stats, self.small_font.render(stats, True, self.TEXT_COLOR))
+        stats_surface = self._stats_cache[1]
+        status_blits = [(stats_surface, (self.MARGIN, row1_y))]
 
         # Bottom row: keyboard hint (grey, left-aligned)
         row2_y = y + 32
         if self.editing:
-            mod_key = "Cmd" if IS_MAC else "Ctrl"
-            hint = f"EDITING — {mod_key}+Enter=save | ESC=cancel | {mod_key}+V=paste"
-            hint_surface = self.small_font.render(hint, True, self.CURRENT_COLOR)
+            hint_surface = self._render_text(self.small_font, self.EDITING_HINT, self.CURRENT_COLOR)
         else:
-            hint = "SPACE=mark | DEL=unmark | P=play/pause | Arrow keys=seek"
-            hint_surface = self.small_font.render(hint, True, self.DIM_COLOR)
-        self.screen.blit(hint_surface, (self.MARGIN, row2_y))
+            hint_surface = self._render_text(self.small_font, self.IDLE_HINT, self.DIM_COLOR)
+        status_blits.append((hint_surface, (self.MARGIN, row2_y)))
 
         # Status message (right-aligned, vertically centered)
-        if pygame.time.get_ticks() < self.status_time:
-            status_surface = self.small_font.render(self.status_message, True, self.CURRENT_COLOR)
-            status_rect = status_surface.get_rect(right=panel_x - 10, centery=y + bar_h // 2)
-            self.screen.blit(status_surface, status_rect)
+        if self._status_surface is not None:
+            status_rect = self._status_surface.get_rect(right=panel_x - 10, centery=y + bar_h // 2)
+            status_blits.append((self._status_surface, status_rect))
+        self.screen.blits(status_blits, doreturn=False)
+
+        # While the window already shows this panel, present only the area
+        # left of it; a new panel (hover, resize) or an expose flips it all
+        if panel is self._presented_panel:
+            pygame.display.update((0, 0, panel_x, self.HEIGHT))
+        else:
+            pygame.display.flip()
+            self._presented_panel = panel
+
+    def _get_button_panel(self):
+        """The right-hand control panel (background, labels and buttons) as one surface."""
+        panel_x = self.WIDTH - self.BUTTON_PANEL_WIDTH
+        key = (self.buttons, self.HEIGHT, tuple(button.is_hovered for button in self.buttons))
+        if self._button_panel_key == key:
+            return self._button_panel_surface
 
-        pygame.display.flip()
+        panel = pygame.Surface((self.BUTTON_PANEL_WIDTH, self.HEIGHT))
+        panel.fill(self.PANEL_COLOR)
+
+        # Panel divider — 4px gradient shadow for depth
+        panel.blit(self._get_panel_divider(), (0, 0))
+
+        # Panel header — uppercase "CONTROLS" with thin underline
+        header_text = self._render_text(self.label_font, "CONTROLS", self.DIM_COLOR)
+        header_x = 10
+        header_y = 16
+        panel.blit(header_text, (header_x, header_y))
+        underline_y = header_y + header_text.get_height() + 3
+        pygame.draw.line(panel, self.ACCENT_COLOR,
+                         (header_x, underline_y),
+                         (self.BUTTON_PANEL_WIDTH - 10, underline_y), 1)
+
+        # Panel section labels
+        for label_surf, label_y in self.panel_labels:
+            panel.blit(label_surf, (10, label_y))
+            line_y = label_y + label_surf.get_height() + 1
+            pygame.draw.line(panel, self.ACCENT_COLOR,
+                             (10 + label_surf.get_width() + 6, line_y),
+                             (self.BUTTON_PANEL_WIDTH - 10, line_y), 1)
+
+        # Buttons
+        for button in self.buttons:
+            button.draw(panel, self.button_font, offset=(panel_x, 0))
+
+        self._button_panel_surface = panel
+        self._button_panel_key = key
+        return panel
+
+    def _get_panel_divider(self):
+        """The 4px shadow along the panel's left edge (rebuilt only when the height changes)."""
+        if self._panel_divider is None or self._panel_divider.get_height() != self.HEIGHT:
+            divider = pygame.Surface((4, self.HEIGHT), pygame.SRCALPHA)
+            for i in range(4):
+                alpha = 40 - i * 10
+                shadow_color = (0, 0, 0)
+                divider.fill((*shadow_color, alpha), (i, 0, 1, self.HEIGHT))
+            self._panel_divider = divider
+        return self._panel_divider
+
+    def _layout_lyrics(self, content_width):
+        """Word positions for the lyrics display, cached per word list and width.
+
+        Returns ([(word, x, y)], {word index: y}, ys) with y relative to the
+        top of the lyrics area and ys the same y values as an array (in
+        ascending order). Positions only depend on the words themselves, so
+        marking timings never invalidates the cache.
+        """
+        cache = self._lyrics_layout
+        words = self.lyrics.words
+        if cache is not None and cache[0] is words and cache[1] == content_width:
+            return cache[2]
+
+        # Greedy wrap: a word goes to the next row when it would cross
+        # content_width (even the first word of a row, which the old
+        # per-word loop also did). Within a run of words starting at
+        # MARGIN, word k ends at MARGIN + offset[k] - offset[start] + w[k],
+        # which only grows with k, so each row is found with one
+        # searchsorted instead of a Python step per word.
+        widths = self._get_word_widths().astype(np.int64)
+        is_break = np.fromiter((w.word == '\n' for w in words), dtype=bool, count=len(words))
+        advance = np.where(is_break, 0, widths + 10)
+        offset = np.cumsum(advance) - advance  # x of each word relative to the start of its run
+        word_end = offset + widths
+        limit = content_width - self.MARGIN
+
+        rows = np.zeros(len(words), dtype=np.int64)
+        xs = np.zeros(len(words), dtype=np.int64)
+        row = 0
+        para_start = 0
+        for para_end in [*np.flatnonzero(is_break).tolist(), len(words)]:
+            start = para_start
+            if start < para_end and widths[start] > limit:
+                row += 1
+            while start < para_end:
+                end = int(np.searchsorted(word_end, limit + offset[start], side='right'))
+                end = min(max(end, start + 1), para_end)
+                rows[start:end] = row
+                xs[start:end] = self.MARGIN + offset[start:end] - offset[start]
+                start = end
+                if start < para_end:
+                    row += 1
+            row += 1  # the line break itself
+            para_start = para_end + 1
+
+        placed = np.flatnonzero(~is_break)
+        ys = rows[placed] * self.LINE_HEIGHT
+        layout = list(zip([words[i] for i in placed.tolist()], xs[placed].tolist(), ys.tolist()))
+        row_y = {word.index: ly for word, _, ly in layout}
+
+        self._lyrics_layout = (words, content_width, (layout, row_y, ys))
+        return layout, row_y, ys
+
+    def _get_word_widths(self):
+        """Pixel width of every entry in lyrics.words (0 for line breaks).
+
+        Measured with font.size(), which lays out glyphs without rasterizing
+        them; kept until a different word list is loaded, so a resize only
+        redoes the wrapping.
+        """
+        words = self.lyrics.words
+        if self._word_widths[0] is not words:
+            font = self.font
+            widths = np.fromiter((0 if w.word == '\n' else font.size(w.word)[0] for w in words),
+                                 dtype=np.int32, count=len(words))
+            self._word_widths = (words, widths)
+        return self._word_widths[1]
 
     def _wrap_edit_text(self, max_width):
         """Word-wrap edit_text and track cursor position through the wrap.
@@ -1335,39 +1701,43 @@ class LyricVideoCreator:
         wrapped line begins, so the cursor can be mapped correctly across
         both hard newlines and soft word-wrap breaks.
         """
-        lines = []
-        line_starts = []
-        src_pos = 0  # current position in self.edit_text
-
-        for raw_line in self.edit_text.split('\n'):
-            if not raw_line:
-                lines.append('')
-                line_starts.append(src_pos)
-                src_pos += 1  # skip the '\n'
-                continue
-
-            # Greedy word-wrap within this paragraph
-            words = raw_line.split(' ')
-            current = ''
-            line_offset = src_pos  # where this wrapped line starts in source
-
-            for i, word in enumerate(words):
-                test = (current + ' ' + word) if current else word
-                test_width = self.font.size(test)[0]
-
-                if test_width > max_width and current:
-                    # Emit the current wrapped line
-                    lines.append(current)
-                    line_starts.append(line_offset)
-                    line_offset += len(current) + 1  # +1 for the space
-                    current = word
-                else:
-                    current = test
+        # Re-wrap only when the text or width changed; every edit assigns a
+        # new string to edit_text, so an identity check is enough.
+        cache = self._wrap_cache
+        if cache is None or cache[0] is not self.edit_text or cache[1] != max_width:
+            lines, line_starts = self._wrap_lines(self.edit_text, max_width)
+            self._wrap_cache = (self.edit_text, max_width, lines, line_starts)
+        else:
+            lines, line_starts = cache[2], cache[3]
+
+        # Find cursor row/col: the last row starting at or before the cursor,
+        # stepped back while the previous row also ends at it (soft wraps),
+        # so the first row containing the cursor wins
+        cursor = self.edit_cursor
+        row = bisect.bisect_right(line_starts, cursor) - 1
+        if row >= 0 and cursor <= line_starts[row] + len(lines[row]):
+            while row > 0 and cursor <= line_starts[row - 1] + len(lines[row - 1]):
+                row -= 1
+            cursor_row = row
+            cursor_col = cursor - line_starts[row]
+        else:
+            cursor_row = len(lines) - 1
+            cursor_col = len(lines[-1])
 
-            # Emit remaining text in paragraph
-            lines.append(current)
-            line_starts.append(line_offset)
+        return lines, cursor_row, cursor_col, line_starts
 
+    def _wrap_lines(self, text, max_width):
+        """Greedy word-wrap text to max_width; returns (lines, line_starts)."""
+        lines = []
+        line_starts = []
+        src_pos = 0  # current position in text
+
+        # Paragraphs are wrapped independently (and memoized), so an edit
+        # only re-measures the paragraph it touched
+        for raw_line in text.split('\n'):
+            for offset, line in _wrap_paragraph(self.font, raw_line, max_width):
+                lines.append(line)
+                line_starts.append(src_pos + offset)
             src_pos += len(raw_line) + 1  # +1 for '\n'
 
         # Handle empty text
@@ -1375,37 +1745,18 @@ class LyricVideoCreator:
             lines = ['']
             line_starts = [0]
 
-        # Find cursor row/col
-        cursor_row = 0
-        cursor_col = 0
-        for row in range(len(lines)):
-            start = line_starts[row]
-            end = start + len(lines[row])
-            if start <= self.edit_cursor <= end:
-                cursor_row = row
-                cursor_col = self.edit_cursor - start
-                break
-        else:
-            cursor_row = len(lines) - 1
-            cursor_col = len(lines[-1])
-
-        return lines, cursor_row, cursor_col, line_starts
+        return lines, line_starts
 
     def _draw_editor(self, top_y, content_width, area_height):
         """Draw the inline text editor in the lyrics area."""
-        # Reserve space for buttons below the text box
-        btn_h = 32
-        btn_gap = 10
-        btn_area = btn_h + btn_gap * 2
-        text_area_height = area_height - btn_area
+        (edit_rect, clip_rect, text_area_height, wrap_width,
+         button_rects, hint_pos) = self._editor_layout(top_y, content_width, area_height)
 
         # Background for edit area
-        edit_rect = pygame.Rect(self.MARGIN - 5, top_y - 5, content_width + 10, text_area_height + 10)
         pygame.draw.rect(self.screen, (30, 30, 30), edit_rect, border_radius=4)
         pygame.draw.rect(self.screen, (80, 80, 80), edit_rect, 1, border_radius=4)
 
         # Wrap text and find cursor
-        wrap_width = content_width - 10  # small padding
         lines, cursor_row, cursor_col, line_starts = self._wrap_edit_text(wrap_width)
 
         line_h = self.LINE_HEIGHT
@@ -1427,40 +1778,54 @@ class LyricVideoCreator:
         self.edit_scroll_y = max(0, self.edit_scroll_y)
 
         # Clip rendering to the edit area
-        clip_rect = pygame.Rect(self.MARGIN, top_y, content_width, text_area_height)
         self.screen.set_clip(clip_rect)
 
         # Selection range in source text
         sel_start, sel_end = self._get_selection_range() if self._has_selection() else (0, 0)
         has_sel = self._has_selection()
-
-        # Draw lines with selection highlight
-        for row, line in enumerate(lines):
-            draw_y = top_y + row * line_h - self.edit_scroll_y
-            if draw_y + line_h < top_y or draw_y > top_y + text_area_height:
-                continue  # off-screen
+        # Rows that can hold part of the selection: from the row the
+        # selection starts in up to the last row starting before its end
+        sel_row_lo = max(0, bisect.bisect_right(line_starts, sel_start) - 1)
+        sel_row_hi = bisect.bisect_left(line_starts, sel_end) if has_sel else 0
+
+        # Draw lines with selection highlight; highlights go straight to the
+        # screen, the text on top of them is blitted in one batch
+        line_blits = []
+        append = line_blits.append
+        font, screen, margin = self.font, self.screen, self.MARGIN
+        render_word, text_color = self._render_word, self.TEXT_COLOR
+        first_y = top_y - self.edit_scroll_y
+        # Only walk the rows that touch the text area: the first one whose
+        # bottom edge reaches top_y through the last one starting above its end
+        first_row = max(0, -((line_h - self.edit_scroll_y) // line_h))
+        last_row = min(len(lines), (self.edit_scroll_y + text_area_height) // line_h + 1)
+        for row in range(first_row, last_row):
+            line = lines[row]
+            if not line:
+                continue  # blank row: no text, and a selection over it spans zero width
+            draw_y = first_y + row * line_h
 
             # Draw selection highlight for this line
-            if has_sel and line_starts[row] < sel_end and line_starts[row] + len(line) >= sel_start:
+            if sel_row_lo <= row < sel_row_hi:
                 ls = line_starts[row]
                 # Clamp selection to this line
                 local_start = max(0, sel_start - ls)
                 local_end = min(len(line), sel_end - ls)
                 if local_start < local_end:
-                    x1 = self.MARGIN + self.font.size(line[:local_start])[0]
-                    x2 = self.MARGIN + self.font.size(line[:local_end])[0]
-                    sel_rect = pygame.Rect(x1, draw_y, x2 - x1, line_h - 2)
-                    pygame.draw.rect(self.screen, (60, 60, 80), sel_rect)
+                    widths = _prefix_widths(font, line)
+                    x1 = margin + widths[local_start]
+                    x2 = margin + widths[local_end]
+                    pygame.draw.rect(screen, (60, 60, 80), (x1, draw_y, x2 - x1, line_h - 2))
 
-            if line:
-                text_surface = self.font.render(line, True, self.TEXT_COLOR)
-                self.screen.blit(text_surface, (self.MARGIN, draw_y))
+            # Shares the word cache: lyrics aren't drawn while editing,
+            # and unchanged lines survive the cursor blink and scrolling
+            append((render_word(line, text_color), (margin, draw_y)))
+        screen.blits(line_blits, doreturn=False)
 
         # Draw blinking cursor (hide when selection is active)
-        blink = (pygame.time.get_ticks() // 500) % 2 == 0
-        if blink and not has_sel:
+        if self._blink_on and not has_sel:
             cursor_line = lines[cursor_row] if cursor_row < len(lines) else ''
-            cursor_x = self.MARGIN + self.font.size(cursor_line[:cursor_col])[0]
+            cursor_x = self.MARGIN + _prefix_widths(self.font, cursor_line)[cursor_col]
             cursor_y = top_y + cursor_row * line_h - self.edit_scroll_y
             pygame.draw.line(self.screen, self.CURRENT_COLOR, (cursor_x, cursor_y), (cursor_x, cursor_y + line_h - 4), 2)
 
@@ -1468,46 +1833,177 @@ class LyricVideoCreator:
         self.screen.set_clip(None)
 
         # Position and draw Save / Cancel buttons below the text box
-        btn_y = top_y + text_area_height + btn_gap
-        btn_w = 100
         if len(self.edit_buttons) >= 2:
-            self.edit_buttons[0].rect = pygame.Rect(self.MARGIN, btn_y, btn_w, btn_h)
-            self.edit_buttons[1].rect = pygame.Rect(self.MARGIN + btn_w + btn_gap, btn_y, btn_w, btn_h)
+            self.edit_buttons[0].rect, self.edit_buttons[1].rect = button_rects
             for btn in self.edit_buttons:
                 btn.draw(self.screen, self.button_font)
 
         # Keyboard hint next to buttons
-        mod_key = "Cmd" if IS_MAC else "Ctrl"
-        hint_text = f"{mod_key}+Enter = save  |  ESC = cancel"
-        hint_surface = self.small_font.render(hint_text, True, self.DIM_COLOR)
-        hint_x = self.MARGIN + (btn_w + btn_gap) * 2 + 10
-        self.screen.blit(hint_surface, (hint_x, btn_y + 8))
+        hint_surface = self._render_text(self.small_font, self.EDITOR_BUTTONS_HINT, self.DIM_COLOR)
+        self.screen.blit(hint_surface, hint_pos)
+
+    def _editor_layout(self, top_y, content_width, area_height):
+        """Editor geometry for the current panel size; recomputed only on resize.
+
+        Returns (edit_rect, clip_rect, text_area_height, wrap_width,
+        (save_rect, cancel_rect), hint_pos). The rects are shared between
+        frames and must not be modified in place.
+        """
+        key = (top_y, content_width, area_height)
+        if self._editor_layout_cache is not None and self._editor_layout_cache[0] == key:
+            return self._editor_layout_cache[1]
+
+        # Reserve space for buttons below the text box
+        btn_h = 32
+        btn_gap = 10
+        btn_area = btn_h + btn_gap * 2
+        text_area_height = area_height - btn_area
+
+        edit_rect = pygame.Rect(self.MARGIN - 5, top_y - 5, content_width + 10, text_area_height + 10)
+        clip_rect = pygame.Rect(self.MARGIN, top_y, content_width, text_area_height)
+        wrap_width = content_width - 10  # small padding
+
+        btn_y = top_y + text_area_height + btn_gap
+        btn_w = 100
+        button_rects = (pygame.Rect(self.MARGIN, btn_y, btn_w, btn_h),
+                        pygame.Rect(self.MARGIN + btn_w + btn_gap, btn_y, btn_w, btn_h))
+        hint_pos = (self.MARGIN + (btn_w + btn_gap) * 2 + 10, btn_y + 8)
+
+        layout = (edit_rect, clip_rect, text_area_height, wrap_width, button_rects, hint_pos)
+        self._editor_layout_cache = (key, layout)
+        return layout
 
     def _format_time(self, seconds):
         """Format seconds as mm:ss."""
-        mins = int(seconds // 60)
-        secs = int(seconds % 60)
-        return f"{mins}:{secs:02d}"
+        mins, secs = divmod(seconds, 60)
+        return f"{int(mins)}:{int(secs):02d}"
+
+    def _panel_buttons_bbox(self):
+        """Union of the panel button rects, rebuilt when the button list is.
+
+        The buttons only move when a resize recreates the list, so the box
+        rejects pointer positions over the lyrics area with a single test.
+        """
+        buttons, bbox = self._buttons_bbox
+        if buttons is not self.buttons:
+            buttons = self.buttons
+            bbox = buttons[0].rect.unionall([btn.rect for btn in buttons[1:]])
+            self._buttons_bbox = (buttons, bbox)
+        return bbox
 
     def _update_cursor(self):
         """Set mouse cursor to hand if hovering over any clickable element."""
         mx, my = pygame.mouse.get_pos()
-        active_buttons = self.edit_buttons if self.editing else self.buttons
-        for btn in active_buttons:
-            if btn.rect.collidepoint(mx, my):
-                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
-                return
-        pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+        if self.editing:
+            hovering = any(btn.rect.collidepoint(mx, my) for btn in self.edit_buttons)
+        else:
+            hovering = (self._panel_buttons_bbox().collidepoint(mx, my)
+                        and any(btn.rect.collidepoint(mx, my) for btn in self.buttons))
+        if hovering:
+            cursor = pygame.SYSTEM_CURSOR_HAND
+        else:
+            cursor = pygame.SYSTEM_CURSOR_ARROW
+        # set_cursor is a window-system call; only make it on a change
+        if cursor != self._cursor_kind:
+            pygame.mouse.set_cursor(cursor)
+            self._cursor_kind = cursor
+
+    @staticmethod
+    def _collapse_mouse_motion(events):
+        """Keep only the last of each run of consecutive MOUSEMOTION events.
+
+        A high-rate mouse queues many motions per frame, and each one is
+        hit-tested against every button; hover and drag-select only care
+        where the pointer ended up. Motions separated by other events (a
+        click, a key) are kept, so those still see the pointer where it was.
+        """
+        motion = None
+        for event in events:
+            if event.type == MOUSEMOTION:
+                motion = event
+                continue
+            if motion is not None:
+                yield motion
+                motion = None
+            yield event
+        if motion is not None:
+            yield motion
+
+    def _coalesce_text_input(self, events):
+        """Merge the TEXTINPUT events of one batch into as few events as possible.
+
+        Fast typing or an IME can deliver many characters per frame; inserting
+        them as one string rebuilds edit_text once instead of per character.
+        Typing interleaves KEYDOWN/KEYUP events the editor ignores, so those
+        don't split a run; any other event flushes the pending text first.
+        """
+        pending = []
+        for event in events:
+            if self.editing and event.type == TEXTINPUT:
+                pending.append(event.text)
+                continue
+            if pending and not self._is_ignored_edit_key(event):
+                yield pygame.event.Event(TEXTINPUT, text=''.join(pending))
+                pending = []
+            yield event
+        if pending:
+            yield pygame.event.Event(TEXTINPUT, text=''.join(pending))
+
+    @staticmethod
+    def _is_ignored_edit_key(event):
+        """True for key events the editor does nothing with (their text comes as TEXTINPUT)."""
+        if event.type == pygame.KEYUP:
+            return True
+        return (event.type == KEYDOWN and event.unicode != '' and event.unicode.isprintable()
+                and not event.mod & (pygame.KMOD_CTRL | pygame.KMOD_META))
+
+    def _frame_state(self):
+        """Playback and hover inputs to draw(); the screen is stale when this changes.
+
+        The caret blink arrives as CURSOR_BLINK_EVENT and marks the frame
+        dirty like any other event. Pointer motion doesn't, so the panel
+        hover states are compared here instead.
+        """
+        return (self.audio.is_playing(), self.audio.is_paused(),
+                tuple(button.is_hovered for button in self.buttons))
+
+    def _next_events(self):
+        """Events for this frame; while idle, sleeps in SDL until one arrives.
+
+        Nothing on screen changes between events when audio isn't playing
+        (blink and status expiry are timer events), so there is no need to
+        poll at the frame rate. The timeout bounds how long a missed state
+        change could go unpainted.
+        """
+        if self._dirty or self.audio.is_playing():
+            return pygame.event.get()
+        event = pygame.event.wait(250)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
 
     def run(self):
         """Main loop."""
         try:
             while self.running:
-                for event in pygame.event.get():
+                events = self._collapse_mouse_motion(self._next_events())
+                for event in self._coalesce_text_input(events):
                     self.handle_event(event)
+                    # Outside the editor, motion only shows through hover
+                    # (see _frame_state()); paused lyrics aren't repainted
+                    # just because the pointer crossed them
+                    if event.type != MOUSEMOTION or self.editing:
+                        self._dirty = True
 
                 self._update_cursor()
-                self.draw()
+
+                # Skip the repaint while idle (nothing playing, no input, no
+                # status expiry or cursor blink); playback always redraws.
+                state = self._frame_state()
+                if self._dirty or state[0] or state != self._drawn_state:
+                    self.draw()
+                    self._dirty = False
+                    self._drawn_state = state
                 self.clock.tick(30)
 
         finally:
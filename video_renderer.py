@@ -1,6 +1,8 @@
 """Video renderer for karaoke-style lyrics video with word-by-word highlighting."""
 import bisect
 import os
+from functools import lru_cache
+from typing import Optional, cast
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 import numpy as np
 from moviepy import VideoClip, AudioFileClip, VideoFileClip
@@ -12,6 +14,80 @@ from utils import resource_path
 DEFAULT_BG_VIDEO = "Red to Blue Squares - HD Video Background Loop [pVNbWKa6qbg].mp4"
 
 
+@lru_cache(maxsize=8192)
+def _text_width(font, text):
+    """Rendered width of text in font; every frame measures the same lines and words."""
+    bbox = font.getbbox(text)
+    return bbox[2] - bbox[0] if bbox else 0
+
+
+@lru_cache(maxsize=None)
+def _load_font(size):
+    """Load the bold sans-serif font at size, once per size.
+
+    Renderers and previews at the same size share the font object, so the
+    width and line tile caches below (keyed by font) carry over between them.
+    """
+    font_options = [
+        ("/System/Library/Fonts/Supplemental/Arial Bold.ttf", None),
+        ("/System/Library/Fonts/Helvetica.ttc", 1),
+        ("/Library/Fonts/Arial Bold.ttf", None),
+        ("/System/Library/Fonts/Avenir Next.ttc", 10),
+        ("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", None),
+        ("C:/Windows/Fonts/arialbd.ttf", None),
+    ]
+
+    for path, index in font_options:
+        if os.path.exists(path):
+            try:
+                if index is not None:
+                    return ImageFont.truetype(path, size, index=index)
+                else:
+                    return ImageFont.truetype(path, size)
+            except (OSError, Exception):
+                continue
+
+    try:
+        return ImageFont.truetype("Arial Bold", size)
+    except:
+        return ImageFont.load_default()
+
+
+# Drop shadow: the text repeated in black at these offsets, under the text
+_SHADOW_STEPS = ((2, 2), (3, 3), (4, 4))
+
+
+@lru_cache(maxsize=64)
+def _line_tile(font, words):
+    """Rasterize a line of (text, x, color) words, shadows included, to an RGBA tile.
+
+    Returns (tile, left, top); a line drawn at y goes at (left, y + top).
+    A line only changes when one of its words gets highlighted, so frames
+    mostly reuse tiles instead of running four FreeType renders per word.
+    """
+    pad = _SHADOW_STEPS[-1]
+    boxes = []
+    for text, x, _ in words:
+        bbox = font.getbbox(text)
+        boxes.append((x + bbox[0], bbox[1], x + bbox[2] + pad[0], bbox[3] + pad[1]))
+    left = min(box[0] for box in boxes)
+    top = min(box[1] for box in boxes)
+    tile = Image.new('RGBA', (max(box[2] for box in boxes) - left,
+                              max(box[3] for box in boxes) - top), (0, 0, 0, 0))
+
+    for (text, x, color), box in zip(words, boxes):
+        size = (box[2] - box[0], box[3] - box[1])
+        dest = (box[0] - left, box[1] - top)
+        for (ox, oy), ink in [(step, (0, 0, 0)) for step in _SHADOW_STEPS] + [((0, 0), color)]:
+            mask = Image.new('L', size, 0)
+            ImageDraw.Draw(mask).text((x + ox - box[0], oy - box[1]), text, font=font, fill=255)
+            layer = Image.new('RGBA', size, ink[:3])
+            layer.putalpha(mask)
+            tile.alpha_composite(layer, dest)
+
+    return tile, left, top
+
+
 class RenderCancelled(Exception):
     """Raised when the user cancels a render in progress."""
     pass
@@ -72,8 +148,12 @@ class VideoRenderer:
         # Load background video if available
         bg_path = resource_path(DEFAULT_BG_VIDEO)
         if os.path.exists(bg_path):
-            self.bg_clip = VideoFileClip(bg_path)
+            # Have ffmpeg scale while decoding rather than PIL on every frame
+            self.bg_clip = VideoFileClip(bg_path, target_resolution=(self.WIDTH, self.HEIGHT),
+                                         resize_algorithm='lanczos')
             self.bg_duration = self.bg_clip.duration
+            # (source frame, resized image) of the last background frame used
+            self._bg_cache: tuple[Optional[np.ndarray], Optional[Image.Image]] = (None, None)
         else:
             self.bg_clip = None
             self.bg_duration = 0
@@ -89,9 +169,7 @@ class VideoRenderer:
             """Calculate the width of a line of words."""
             if not words:
                 return 0
-            line_text = ' '.join(w.word for w in words)
-            bbox = self.font.getbbox(line_text)
-            return bbox[2] - bbox[0] if bbox else 0
+            return _text_width(self.font, ' '.join(w.word for w in words))
 
         for word in self.lyrics.words:
             if word.word == '\n':
@@ -117,12 +195,44 @@ class VideoRenderer:
         if current_line_words:
             self.lines.append(current_line_words)
 
+        # Horizontal layout only depends on the font and width: centre each
+        # line once and keep every word's x, so frames just draw
+        self.line_layouts = []
+        for line_words in self.lines:
+            x = (self.WIDTH - _text_width(self.font, ' '.join(w.word for w in line_words))) // 2
+            placed = []
+            for word in line_words:
+                placed.append((word, x))
+                x += _text_width(self.font, word.word + ' ')
+            self.line_layouts.append(placed)
+
     def _calculate_timing_info(self):
         """Calculate first word time, gaps, etc."""
         self.first_word_time = None
         self.last_word_time = None
         self.gaps = []  # List of (start_time, end_time) for gaps > threshold
 
+        # Per-line (start, end) and the start of the next timed line after
+        # each one, for _get_current_line_info()
+        self.line_timings = [self._get_line_timing(line_words) for line_words in self.lines]
+        self.next_line_starts = [None] * len(self.lines)
+        next_start = None
+        for i in range(len(self.lines) - 1, -1, -1):
+            self.next_line_starts[i] = next_start
+            if self.line_timings[i][0] is not None:
+                next_start = self.line_timings[i][0]
+
+        # Suffix minimum of the line starts (untimed lines count as never
+        # starting). It is non-decreasing, and the last line started by time
+        # t is bisect_right(..., t) - 1 even when lines were timed out of order
+        self._started_by = [float('inf')] * len(self.lines)
+        earliest = float('inf')
+        for i in range(len(self.lines) - 1, -1, -1):
+            start_time = self.line_timings[i][0]
+            if start_time is not None and start_time < earliest:
+                earliest = start_time
+            self._started_by[i] = earliest
+
         # Find first and last timed words
         timed_words = [(w.start_time, w.index) for w in self.lyrics.words
                        if w.word != '\n' and w.start_time is not None]
@@ -141,29 +251,7 @@ class VideoRenderer:
 
     def _get_font(self) -> ImageFont.FreeTypeFont:
         """Get a bold sans-serif font."""
-        font_options = [
-            ("/System/Library/Fonts/Supplemental/Arial Bold.ttf", None),
-            ("/System/Library/Fonts/Helvetica.ttc", 1),
-            ("/Library/Fonts/Arial Bold.ttf", None),
-            ("/System/Library/Fonts/Avenir Next.ttc", 10),
-            ("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", None),
-            ("C:/Windows/Fonts/arialbd.ttf", None),
-        ]
-
-        for path, index in font_options:
-            if os.path.exists(path):
-                try:
-                    if index is not None:
-                        return ImageFont.truetype(path, self.FONT_SIZE, index=index)
-                    else:
-                        return ImageFont.truetype(path, self.FONT_SIZE)
-                except (OSError, Exception):
-                    continue
-
-        try:
-            return ImageFont.truetype("Arial Bold", self.FONT_SIZE)
-        except:
-            return ImageFont.load_default()
+        return _load_font(self.FONT_SIZE)
 
     def _get_line_timing(self, line_words):
         """Get start and end time for a line based on its words."""
@@ -189,8 +277,7 @@ class VideoRenderer:
         self._kf_times = []
         self._kf_offsets = []
 
-        for i, line_words in enumerate(self.lines):
-            start_time, _ = self._get_line_timing(line_words)
+        for i, (start_time, _) in enumerate(self.line_timings):
             if start_time is not None:
                 self._kf_times.append(start_time)
                 self._kf_offsets.append(i * self.LINE_SPACING)
@@ -280,50 +367,23 @@ class VideoRenderer:
                 fill=self.HIGHLIGHT_COLOR
             )
 
-    def _draw_text_with_shadow(self, img, draw, x, y, text, color, opacity=1.0):
-        """Draw text with a shadow effect."""
-        # Draw shadow directly (simpler, faster)
-        shadow_alpha = int(150 * opacity)
-        shadow_color = (0, 0, 0, shadow_alpha)
-        for ox, oy in [(2, 2), (3, 3), (4, 4)]:
-            draw.text((x + ox, y + oy), text, font=self.font, fill=shadow_color)
-
-        # Draw main text with opacity
-        if opacity < 1.0:
-            alpha = int(255 * opacity)
-            if len(color) == 3:
-                color = color + (alpha,)
-            else:
-                color = color[:3] + (alpha,)
-
-        draw.text((x, y), text, font=self.font, fill=color)
-
     def _get_current_line_info(self, time: float):
         """Get current line index and progress through that line."""
-        current_line_idx = -1
-        line_progress = 0.0
-
-        for i, line_words in enumerate(self.lines):
-            start_time, end_time = self._get_line_timing(line_words)
-            if start_time is None:
-                continue
-
-            if time >= start_time:
-                current_line_idx = i
-                # Get next line's start time for progress
-                next_start = None
-                for j in range(i + 1, len(self.lines)):
-                    next_start_time, _ = self._get_line_timing(self.lines[j])
-                    if next_start_time is not None:
-                        next_start = next_start_time
-                        break
-
-                if next_start and next_start > start_time:
-                    line_progress = min(1.0, (time - start_time) / (next_start - start_time))
-                elif end_time and end_time > start_time:
-                    line_progress = min(1.0, (time - start_time) / max(1.0, end_time - start_time + 1.0))
-                else:
-                    line_progress = 0.5
+        # Last line whose start has passed
+        current_line_idx = bisect.bisect_right(self._started_by, time) - 1
+        if current_line_idx < 0:
+            return -1, 0.0
+
+        start_time, end_time = self.line_timings[current_line_idx]
+        # Next line's start time for progress
+        next_start = self.next_line_starts[current_line_idx]
+
+        if next_start and next_start > start_time:
+            line_progress = min(1.0, (time - start_time) / (next_start - start_time))
+        elif end_time and end_time > start_time:
+            line_progress = min(1.0, (time - start_time) / max(1.0, end_time - start_time + 1.0))
+        else:
+            line_progress = 0.5
 
         return current_line_idx, line_progress
 
@@ -359,12 +419,17 @@ class VideoRenderer:
         if self.bg_clip:
             bg_time = time % self.bg_duration
             bg_frame = self.bg_clip.get_frame(bg_time)
-            img = Image.fromarray(bg_frame).convert('RGBA')
-            # Resize background to match output resolution
-            if img.size != (self.WIDTH, self.HEIGHT):
-                img = img.resize((self.WIDTH, self.HEIGHT), Image.Resampling.LANCZOS)
+            # The reader hands back the same array while output frames stay
+            # on one background frame (~24 fps under 30), so keep its resize
+            if bg_frame is not self._bg_cache[0]:
+                bg_img = Image.fromarray(bg_frame)
+                # Decoded at the output size; resize only if ffmpeg didn't
+                if bg_img.size != (self.WIDTH, self.HEIGHT):
+                    bg_img = bg_img.resize((self.WIDTH, self.HEIGHT), Image.Resampling.LANCZOS)
+                self._bg_cache = (bg_frame, bg_img)
+            img = cast(Image.Image, self._bg_cache[1]).copy()  # filled in just above on a miss
         else:
-            img = Image.new('RGBA', (self.WIDTH, self.HEIGHT), self.BG_COLOR + (255,))
+            img = Image.new('RGB', (self.WIDTH, self.HEIGHT), self.BG_COLOR)
 
         draw = ImageDraw.Draw(img)
 
@@ -372,7 +437,7 @@ class VideoRenderer:
         self._draw_loading_bar(draw, time, self.bg_duration)
 
         if not self.lines:
-            return np.array(img.convert('RGB'))
+            return np.array(img)
 
         # Get current line info for fade calculations
         current_line_idx, line_progress = self._get_current_line_info(time)
@@ -383,8 +448,22 @@ class VideoRenderer:
         # Center Y position
         center_y = self.HEIGHT // 2
 
+        # Word is highlighted if its time has passed (stays highlighted)
+        # Add offset so highlight appears slightly ahead of audio
+        adjusted_time = time + self.HIGHLIGHT_OFFSET
+
+        # Only lines whose y can fall inside the bounds tested below; the
+        # window is rounded outwards, so the per-line test still decides
+        first_line = max(0, int((scroll_offset - center_y - self.FONT_SIZE * 2) // self.LINE_SPACING))
+        end_line = min(len(self.line_layouts),
+                       int((scroll_offset - center_y + self.HEIGHT + self.FONT_SIZE) // self.LINE_SPACING) + 1)
+
         # Draw each line
-        for line_idx, line_words in enumerate(self.lines):
+        for line_idx in range(first_line, end_line):
+            placed_words = self.line_layouts[line_idx]
+            if not placed_words:
+                continue
+
             # Calculate Y position with scrolling
             base_y = center_y + (line_idx * self.LINE_SPACING) - scroll_offset
 
@@ -395,49 +474,22 @@ class VideoRenderer:
             # Calculate opacity for this line (based on position and line index)
             opacity = self._get_line_opacity(line_idx, current_line_idx, line_progress, base_y)
 
-            # Skip fully faded lines
+            # Skip fully faded lines. Partial opacity has no visible effect:
+            # the frame is opaque RGB, so the tile is drawn as is
             if opacity <= 0:
                 continue
 
-            # Calculate line width for centering
-            line_text = ' '.join(w.word for w in line_words)
-            bbox = self.font.getbbox(line_text)
-            line_width = bbox[2] - bbox[0] if bbox else 0
-
-            # Center horizontally
-            start_x = (self.WIDTH - line_width) // 2
-            x = start_x
-
-            # Draw each word
-            for word in line_words:
-                word_text = word.word
-
-                # Word is highlighted if its time has passed (stays highlighted)
-                # Add offset so highlight appears slightly ahead of audio
-                adjusted_time = time + self.HIGHLIGHT_OFFSET
-                is_highlighted = (word.start_time is not None and word.start_time <= adjusted_time)
-
-                # Choose color with opacity
-                if is_highlighted:
-                    base_color = self.HIGHLIGHT_COLOR
-                else:
-                    base_color = self.TEXT_COLOR
-
-                # Apply opacity
-                if opacity < 1.0:
-                    alpha = int(255 * opacity)
-                    color = base_color[:3] + (alpha,) if len(base_color) == 3 else base_color[:3] + (alpha,)
-                else:
-                    color = base_color
-
-                # Draw word with shadow
-                self._draw_text_with_shadow(img, draw, x, base_y, word_text, color, opacity)
-
-                # Move x position for next word
-                word_bbox = self.font.getbbox(word_text + ' ')
-                x += word_bbox[2] - word_bbox[0] if word_bbox else 0
+            # Words at their precomputed x (lines are centred), coloured by highlight
+            words = tuple(
+                (word.word, x,
+                 self.HIGHLIGHT_COLOR if word.start_time is not None and word.start_time <= adjusted_time
+                 else self.TEXT_COLOR)
+                for word, x in placed_words
+            )
+            tile, left, top = _line_tile(self.font, words)
+            img.paste(tile, (left, round(base_y) + top), tile)
 
-        return np.array(img.convert('RGB'))
+        return np.array(img)
 
     def render(self, output_path: str, progress_callback=None, check_cancelled=None):
         """Render the full video to the output path."""
@@ -465,7 +517,11 @@ class VideoRenderer:
                 codec='libx264',
                 audio_codec='aac',
                 threads=4,
-                preset='medium',
+                # x264 dominates export time; veryfast at CRF 20 encodes in
+                # a bit over half the time of medium at the default CRF 23
+                # with about the same quality, for ~20% larger files
+                preset='veryfast',
+                ffmpeg_params=['-crf', '20'],
                 logger=None
             )
         except RenderCancelled: